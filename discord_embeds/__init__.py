@@ -7,3 +7,17 @@ Extended embed module for discord.py
 from .exceptions import *
 from .objects import *
 from .embed import *
+from .template import *
+from .frozen import *
+from .handler import *
+from .fingerprint import *
+from .aggregator import *
+from .batch import *
+from .cache import *
+from .paginator import *
+from .i18n import *
+from .imaging import *
+from .validation import *
+from .dedup import *
+from .offload import *
+from .store import *
@@ -0,0 +1,111 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Union
+from .objects import *
+from .fingerprint import fingerprint_exception, format_traceback
+from .embed import Embed, ERROR_TRACEBACK_LIMIT
+
+"""
+ErrorAggregator
+________________________________________________________________________________________________
+Aggregates repeated exceptions by their fingerprint (type & traceback frames),
+so a crash loop produces a single embed with occurrence counts instead of thousands of embeds.
+Traceback of each fingerprint is formatted & truncated only once, at its first occurrence.
+Records keep the formatted traceback only, not the exception itself (which references its frames & their locals).
+________________________________________________________________________________________________
+"""
+
+
+class ExceptionRecord(object):
+    """
+    Represents aggregated occurrences of exceptions sharing same fingerprint.
+    """
+
+    __slots__ = ("fingerprint", "exception_type", "traceback_text", "count", "first_seen", "last_seen")
+
+    def __init__(self, fingerprint: str, exception_type: str, traceback_text: str, seen: datetime) -> None:
+        self.fingerprint = fingerprint
+        self.exception_type = exception_type
+        self.traceback_text = traceback_text
+        self.count = 1
+        self.first_seen = seen
+        self.last_seen = seen
+
+    def __repr__(self) -> str:
+        return ("ExceptionRecord(fingerprint={},exception_type={},count={},first_seen={},last_seen={})"
+                .format(self.fingerprint, self.exception_type, self.count, self.first_seen, self.last_seen))
+
+
+class ErrorAggregator(object):
+    """
+    Thread-safe store of exception records, bounded by the number of distinct fingerprints.
+    Least recently seen fingerprint is evicted when the store is full.
+    """
+
+    def __init__(self, max_records: int = 1000, title: str = "") -> None:
+        self.max_records = max_records
+        self.title = title
+        self._records: "OrderedDict[str, ExceptionRecord]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, e: BaseException) -> ExceptionRecord:
+        """
+        Record occurrence of given exception.
+        :param e: exception to record.
+        :return: aggregated record of the exception.
+        """
+        fingerprint = fingerprint_exception(e)
+        now = datetime.utcnow()
+        with self._lock:
+            record = self._records.get(fingerprint)
+            if record is not None:
+                record.count += 1
+                record.last_seen = now
+                self._records.move_to_end(fingerprint)
+                return record
+
+        # Format traceback outside of the lock : it is the expensive part.
+        record = ExceptionRecord(fingerprint, type(e).__name__, format_traceback(e, ERROR_TRACEBACK_LIMIT), now)
+        with self._lock:
+            existing = self._records.get(fingerprint)
+            if existing is not None:
+                # Another thread recorded same fingerprint meanwhile.
+                existing.count += 1
+                existing.last_seen = now
+                return existing
+            self._records[fingerprint] = record
+            while len(self._records) > self.max_records:
+                self._records.popitem(last=False)
+        return record
+
+    def get(self, fingerprint: str) -> Optional[ExceptionRecord]:
+        with self._lock:
+            return self._records.get(fingerprint)
+
+    def pop(self, fingerprint: str) -> Optional[ExceptionRecord]:
+        with self._lock:
+            return self._records.pop(fingerprint, None)
+
+    def embed(self, record: Union[ExceptionRecord, str]) -> Embed:
+        """
+        Create error embed of given record, with its occurrence count and first/last seen time.
+        :param record: exception record or its fingerprint.
+        :return: Embed object.
+        """
+        if not isinstance(record, ExceptionRecord):
+            record = self.get(record)
+            if record is None:
+                raise KeyError("Unknown exception fingerprint.")
+        embed = Embed.ERROR_EMBED(self.title, None, traceback_text=record.traceback_text)
+        embed.fields = [
+            Field(name="Count", value=str(record.count), inline=True),
+            Field(name="First seen", value=record.first_seen.isoformat(sep=" ", timespec="seconds"), inline=True),
+            Field(name="Last seen", value=record.last_seen.isoformat(sep=" ", timespec="seconds"), inline=True),
+            Field(name="Fingerprint", value=record.fingerprint, inline=False)
+        ]
+        embed.timestamp = record.last_seen
+        return embed
+
+    def __len__(self) -> int:
+        return len(self._records)
@@ -0,0 +1,100 @@
+from typing import Any, List, Optional, Sequence, Tuple, Union
+from .objects import *
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+"""
+Columnar validation
+________________________________________________________________________________________________
+Validate whole columns of field names and values at once, instead of constructing Field objects
+one by one. Length checks are vectorized using NumPy if it is installed.
+________________________________________________________________________________________________
+* Masks are `numpy.ndarray` of bool when NumPy is available, otherwise list of bool.
+  True means the row is invalid.
+* Columns are sequences or NumPy arrays. Lengths of unicode (`U` dtype) arrays are computed by NumPy itself.
+"""
+
+Mask = Union[List[bool], "np.ndarray"]
+
+
+def check_column(column: Sequence[Any], limit: int) -> Mask:
+    """
+    Check every value of given column is string not longer than given limit.
+    :param column: sequence of values.
+    :param limit: maximum length of each value.
+    :return: mask of failing rows.
+    """
+    if np is None:
+        return [not isinstance(value, str) or len(value) > limit for value in column]
+
+    if isinstance(column, np.ndarray) and column.dtype.kind == "U":
+        # Every value of unicode array is string.
+        return np.char.str_len(column) > limit
+
+    count = len(column)
+    # Common case : every value is string. Types are checked once at C level, then lengths are
+    # collected without any python-level loop. Lengths are collected instead of converting column into
+    # fixed-width unicode array, which would allocate (rows * longest value) characters.
+    if not count or set(map(type, column)) == {str}:
+        return np.fromiter(map(len, column), dtype=np.int64, count=count) > limit
+
+    is_str = np.fromiter((isinstance(value, str) for value in column), dtype=bool, count=count)
+    lengths = np.fromiter((len(value) if isinstance(value, str) else 0 for value in column),
+                          dtype=np.int64, count=count)
+    return ~is_str | (lengths > limit)
+
+
+def as_list(column: Sequence[Any]) -> Sequence[Any]:
+    """
+    Convert NumPy array into list of python objects. (e.g. `numpy.str_` into str) Other sequences are returned as is.
+    """
+    if np is not None and isinstance(column, np.ndarray):
+        return column.tolist()
+    return column
+
+
+def validate_field_rows(names: Sequence[Any], values: Sequence[Any]) -> Mask:
+    """
+    Validate columns of field names and values.
+    :param names: column of field names.
+    :param values: column of field values.
+    :return: mask of failing rows.
+    """
+    if len(names) != len(values):
+        raise ValueError("Columns must have same length : names={}, values={}".format(len(names), len(values)))
+    invalid_names = check_column(names, FIELD_NAME_LIMIT)
+    invalid_values = check_column(values, FIELD_VALUE_LIMIT)
+    if np is None:
+        return [name or value for name, value in zip(invalid_names, invalid_values)]
+    return invalid_names | invalid_values
+
+
+def build_fields(
+        names: Sequence[Any],
+        values: Sequence[Any],
+        inlines: Optional[Sequence[bool]] = None
+) -> Tuple[List[Field], Mask]:
+    """
+    Validate columns of field data, and construct Field objects of valid rows only.
+    :param names: column of field names.
+    :param values: column of field values.
+    :param inlines: column of inline flags. (Default : False for every row)
+    :return: tuple of (fields of valid rows, mask of failing rows)
+    """
+    if inlines is not None and len(inlines) != len(names):
+        raise ValueError("Columns must have same length : names={}, inlines={}".format(len(names), len(inlines)))
+    mask = validate_field_rows(names, values)
+    if np is None:
+        rows = [index for index, invalid in enumerate(mask) if not invalid]
+    else:
+        rows = np.flatnonzero(~mask).tolist()
+    names, values = as_list(names), as_list(values)
+    inlines = as_list(inlines) if inlines is not None else None
+    fields = [
+        Field.unchecked(str(names[row]), str(values[row]), inlines[row] if inlines is not None else False)
+        for row in rows
+    ]
+    return fields, mask
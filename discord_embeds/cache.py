@@ -0,0 +1,97 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+"""
+LRUCache
+________________________________________________________________________________________________
+Thread-safe least-recently-used cache, bounded by number of entries and optionally by total weight.
+(e.g. estimated size of rendered embeds)
+________________________________________________________________________________________________
+"""
+
+_MISSING = object()
+
+
+class LRUCache(object):
+    """
+    Least-recently-used cache.
+    :param maxsize: maximum number of entries.
+    :param max_weight: maximum sum of weights of entries. (None means unbounded)
+    :param weigher: function calculating weight of a value. Required if `max_weight` is given.
+    """
+
+    def __init__(
+            self,
+            maxsize: int = 128,
+            max_weight: Optional[int] = None,
+            weigher: Optional[Callable[[Any], int]] = None
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize of LRUCache must be positive.")
+        if max_weight is not None and weigher is None:
+            raise ValueError("weigher must be given to bound LRUCache by weight.")
+        self.maxsize = maxsize
+        self.max_weight = max_weight
+        self.weigher = weigher
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._weights = {}
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        weight = self.weigher(value) if self.weigher is not None else 0
+        with self._lock:
+            if key in self._data:
+                self.weight -= self._weights.pop(key, 0)
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if weight:
+                self._weights[key] = weight
+                self.weight += weight
+            self._evict(keep=key)
+
+    def _evict(self, keep: Hashable) -> None:
+        # The entry just inserted is kept even if it exceeds max_weight alone.
+        while len(self._data) > 1 and (
+                len(self._data) > self.maxsize
+                or (self.max_weight is not None and self.weight > self.max_weight)
+        ):
+            key = next(iter(self._data))
+            if key == keep:
+                break
+            del self._data[key]
+            self.weight -= self._weights.pop(key, 0)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            self.weight -= self._weights.pop(key, 0)
+            return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._weights.clear()
+            self.weight = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return ("LRUCache(size={},maxsize={},weight={},max_weight={},hits={},misses={})"
+                .format(len(self._data), self.maxsize, self.weight, self.max_weight, self.hits, self.misses))
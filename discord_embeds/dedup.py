@@ -0,0 +1,113 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple, Union
+from .embed import Embed
+from .frozen import FrozenEmbed
+
+"""
+Deduplication
+________________________________________________________________________________________________
+Content hash of an embed is calculated from its canonical json form. (`Embed.to_dict()` with sorted keys)
+DedupStore suppresses sending identical embeds to the same channel within the TTL.
+If sending fails after `DedupStore.should_send()`, call `DedupStore.discard()` so that retries are not suppressed.
+________________________________________________________________________________________________
+Option            | Effect on content hash
+________________________________________________________________________________________________
+ignore_timestamp  | Embeds differing only by timestamp share the hash. (default : True)
+sort_fields       | Embeds differing only by the order of fields share the hash. (default : False)
+________________________________________________________________________________________________
+"""
+
+EmbedLike = Union[Embed, FrozenEmbed, Dict[str, Any]]
+
+
+def content_hash(embed: EmbedLike, ignore_timestamp: bool = True, sort_fields: bool = False) -> str:
+    """
+    Calculate canonical content hash of given embed.
+    :param embed: Embed, FrozenEmbed or its serialized form.
+    :param ignore_timestamp: whether to exclude timestamp from the hash.
+    :param sort_fields: whether to ignore the order of fields.
+    :return: hex digest of the embed`s content.
+    """
+    payload = embed if isinstance(embed, dict) else embed.to_dict()
+    if ignore_timestamp and "timestamp" in payload:
+        payload = dict(payload)
+        del payload["timestamp"]
+    if sort_fields and payload.get("fields"):
+        payload = dict(payload)
+        payload["fields"] = sorted(payload["fields"], key=lambda field: (field["name"], field["value"], field["inline"]))
+    data = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+
+
+class DedupStore(object):
+    """
+    Thread-safe store of recently sent embeds of each channel.
+    An embed is suppressed for `ttl` seconds after the first send of identical content to the same channel.
+    :param ttl: seconds to suppress identical embeds.
+    :param maxsize: maximum number of remembered (channel, content) pairs.
+    """
+
+    def __init__(self, ttl: float = 10.0, maxsize: int = 100000,
+                 ignore_timestamp: bool = True, sort_fields: bool = False) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.ignore_timestamp = ignore_timestamp
+        self.sort_fields = sort_fields
+        self.hits = 0
+        self.misses = 0
+        # (channel id, content hash) -> expiry. Ordered by expiry, since every entry has the same ttl.
+        self._entries: "OrderedDict[Tuple[Hashable, str], float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _purge(self, now: float) -> None:
+        while self._entries:
+            key, expiry = next(iter(self._entries.items()))
+            if expiry > now and len(self._entries) <= self.maxsize:
+                break
+            del self._entries[key]
+
+    def should_send(self, channel_id: Hashable, embed: EmbedLike) -> bool:
+        """
+        Check whether given embed should be sent to the channel, and remember it if so.
+        :param channel_id: id of the destination channel.
+        :param embed: embed to send.
+        :return: False if identical embed was sent to the channel within the TTL.
+        """
+        key = (channel_id, content_hash(embed, self.ignore_timestamp, self.sort_fields))
+        now = time.monotonic()
+        with self._lock:
+            expiry = self._entries.get(key)
+            if expiry is not None and expiry > now:
+                self.hits += 1
+                return False
+            self.misses += 1
+            self._entries[key] = now + self.ttl
+            self._entries.move_to_end(key)
+            self._purge(now)
+            return True
+
+    def discard(self, channel_id: Hashable, embed: EmbedLike) -> bool:
+        """
+        Forget given embed sent to the channel, e.g. when sending it has failed.
+        :param channel_id: id of the destination channel.
+        :param embed: embed passed to `DedupStore.should_send()`.
+        :return: True if the embed was remembered.
+        """
+        key = (channel_id, content_hash(embed, self.ignore_timestamp, self.sort_fields))
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return ("DedupStore(ttl={},size={},hits={},misses={})"
+                .format(self.ttl, len(self._entries), self.hits, self.misses))
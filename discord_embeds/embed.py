@@ -1,10 +1,14 @@
-from typing import List, Dict, Union, Optional
+from typing import Any, Callable, List, Dict, Union, Optional
 from .exceptions import *
 from .objects import *
-from discord import Member, User, ClientUser, Colour
+from .fingerprint import format_traceback
+from .offload import get_offloader
+from discord import Colour
 from discord import Embed as DiscordEmbed
 
-ANY_USER = Union[User, Member, ClientUser]
+ERROR_DESCRIPTION_PREFIX = "Error content : \n```py\n"
+ERROR_DESCRIPTION_SUFFIX = "```"
+ERROR_TRACEBACK_LIMIT = DESCRIPTION_LIMIT - len(ERROR_DESCRIPTION_PREFIX) - len(ERROR_DESCRIPTION_SUFFIX)
 
 """
 ExtendedEmbed Structure
@@ -44,30 +48,19 @@ class Embed(DiscordEmbed):
                  provider: Optional[Union[ProviderObject, Dict[str, Any]]] = None,
                  fields: Optional[Union[Fields, List[Field]]] = None
                  ):
-        self._type: EmbedType = embed_type if embed_type in EmbedType else EmbedType.from_value(embed_type)
+        self._type: EmbedType = process_type(embed_type)
         self._title: str = process_title(title)
-        self._url: str = url if validate_url(url) else None
+        self._url: str = get_policy().optional_url(url, "url")
         self._description: str = process_desc(description)
-
-        if isinstance(color, Colour):
-            self._color = color
-        elif isinstance(color, str):
-            color = getattr(Colour, color, None)
-            if isinstance(color, classmethod):
-                self._color = color()
-            else:
-                self._color = Colour.blurple()
-                raise ValueError("Invalid color key is passed.")
+        self._color: Optional[Colour] = process_color(color)
 
         self._timestamp: datetime = timestamp if type(timestamp) == datetime else None
-        self._author: AuthorObject = author if isinstance(author, AuthorObject) else AuthorObject.fromDict(author)
-        self._footer: FooterObject = footer if isinstance(footer, FooterObject) else FooterObject.fromDict(footer)
-        self._thumbnail: ImageObject = thumbnail if isinstance(thumbnail, ImageObject) else ImageObject.fromDict(
-            thumbnail)
-        self._image: ImageObject = image if isinstance(image, ImageObject) else ImageObject.fromDict(image)
-        self._provider: ProviderObject = provider if isinstance(provider,
-                                                                ProviderObject) else ProviderObject.fromDict(provider)
-        self._fields: Fields = Fields.fromDict(fields)
+        self._author: Optional[AuthorObject] = process_object(AuthorObject, author)
+        self._footer: Optional[FooterObject] = process_object(FooterObject, footer)
+        self._thumbnail: Optional[ImageObject] = process_image(thumbnail)
+        self._image: Optional[ImageObject] = process_image(image)
+        self._provider: Optional[ProviderObject] = process_object(ProviderObject, provider)
+        self._fields: List[Field] = process_fields(fields)
 
     @property
     def title(self) -> str:
@@ -85,7 +78,7 @@ class Embed(DiscordEmbed):
     @type.setter
     def type(self, value: str) -> NoReturn:
         # Type Check & Value Assign
-        self._type = EmbedType.from_value(value)
+        self._type = process_type(value)
 
     @property
     def description(self) -> str:
@@ -93,9 +86,9 @@ class Embed(DiscordEmbed):
 
     @description.setter
     def description(self, value: str) -> NoReturn:
-        # Type Check & Value Assign
-        if check_desc(value):
-            self._description = value
+        # Type Check & Value Assign (Invalid value is ignored, unless it can be truncated in lenient mode)
+        if check_desc(value) or get_policy().lenient:
+            self._description = process_desc(value)
 
     @property
     def color(self) -> Colour:
@@ -103,10 +96,7 @@ class Embed(DiscordEmbed):
 
     @color.setter
     def color(self, value: Colour) -> NoReturn:
-        if isinstance(value, Colour):
-            self._color = value
-        else:
-            self._color = process_color(value)
+        self._color = process_color(value)
 
     @property
     def author(self) -> AuthorObject:
@@ -114,7 +104,7 @@ class Embed(DiscordEmbed):
 
     @author.setter
     def author(self, value: AuthorObject) -> NoReturn:
-        self._author = AuthorObject.fromDict(value)
+        self._author = process_object(AuthorObject, value)
 
     @property
     def footer(self) -> Dict[str, str]:
@@ -122,7 +112,7 @@ class Embed(DiscordEmbed):
 
     @footer.setter
     def footer(self, value: Dict[str, str]) -> NoReturn:
-        self._footer = FooterObject.fromDict(value)
+        self._footer = process_object(FooterObject, value)
 
     @property
     def timestamp(self) -> datetime:
@@ -133,7 +123,7 @@ class Embed(DiscordEmbed):
         if isinstance(value, datetime):
             self._timestamp = value
         else:
-            raise TypeError("Timestamp object must be an instance of datetime")
+            get_policy().invalid("Timestamp object must be an instance of datetime", TypeError)
 
     @property
     def url(self) -> str:
@@ -141,7 +131,8 @@ class Embed(DiscordEmbed):
 
     @url.setter
     def url(self, value) -> NoReturn:
-        if validate_url(value):
+        value = get_policy().optional_url(value, "url")
+        if value is not None:
             self._url = value
 
     @property
@@ -151,13 +142,7 @@ class Embed(DiscordEmbed):
     @thumbnail.setter
     def thumbnail(self, value: Union[ImageObject, str]) -> NoReturn:
         # Type Check & Value Assign
-        try:
-            self._thumbnail = ImageObject.fromDict(value)
-        except:
-            if validate_url(value):
-                self._thumbnail = ImageObject(url=value)
-            else:
-                raise
+        self._thumbnail = process_image(value)
 
     @property
     def image(self) -> ImageObject:
@@ -166,13 +151,7 @@ class Embed(DiscordEmbed):
     @image.setter
     def image(self, value: Union[ImageObject, str]) -> NoReturn:
         # Type Check & Value Assign
-        try:
-            self._image = ImageObject.fromDict(value)
-        except:
-            if validate_url(value):
-                self._image = ImageObject(url=value)
-            else:
-                raise
+        self._image = process_image(value)
 
     @property
     def fields(self) -> List[Field]:
@@ -180,18 +159,18 @@ class Embed(DiscordEmbed):
 
     @fields.setter
     def fields(self, value: List[Field]) -> NoReturn:
-        # Type Check
-        self._fields = Fields.fromDict(value)
-
-        if check_fields(value):
-            # Value Assign
-            self._fields.extend(value)
+        # Type Check & Value Assign
+        self._fields = process_fields(value)
 
     async def add_field(self, name, value, inline=False):
+        policy = get_policy()
         if type(name) != str or type(value) != str:
-            raise TypeError("Invalid type of parameter was passed in method : "
-                            "EmbedFactory.add_field(str, str, bool")
-        self.fields.append({"name": name, "value": value, "inline": inline})
+            policy.invalid("Invalid type of parameter was passed in method : "
+                           "EmbedFactory.add_field(str, str, bool", TypeError)
+        if len(self.fields) >= FIELDS_LIMIT:
+            policy.invalid("Embed cannot have more than {} fields.".format(FIELDS_LIMIT))
+            return
+        self.fields.append(Field(name=name, value=value, inline=inline))
 
     async def add_fields(self, *fields: Field) -> NoReturn:
         for field in fields:
@@ -207,6 +186,14 @@ class Embed(DiscordEmbed):
     async def convert(self) -> DiscordEmbed:
         """
         Convert this embed object to discord.py's embed object.
+        Large embeds are converted in the executor of `configure_offloading()`, not to block the event loop.
+        :return:
+        """
+        return await get_offloader().run(self.convert_sync, size=self.estimate_size())
+
+    def convert_sync(self) -> DiscordEmbed:
+        """
+        Convert this embed object to discord.py's embed object, in the current thread.
         :return:
         """
         embed = DiscordEmbed(
@@ -218,40 +205,106 @@ class Embed(DiscordEmbed):
         if self.image:
             embed.set_image(url=self.image.url)
 
-        if self.author["name"] != "" and self.author["icon_url"] != "":
-            embed.set_author(name=self.author["name"], icon_url=self.author["icon_url"])
+        if self.author and self.author.name != "" and self.author.icon_url:
+            embed.set_author(name=self.author.name, icon_url=self.author.icon_url)
 
         for field in self.fields:
-            embed.add_field(name=field["name"], value=field["value"],
-                            inline=bool(field["inline"]) if "inline" in field else False)
+            embed.add_field(name=field.name, value=field.value, inline=field.inline)
 
-        if self.footer["text"] != "" and self.footer["icon_url"] != "":
-            embed.set_footer(text=self.footer["text"], icon_url=self.footer["icon_url"])
+        if self.footer and self.footer.text and self.footer.icon_url:
+            embed.set_footer(text=self.footer.text, icon_url=self.footer.icon_url)
 
         return embed
 
+    async def to_dict_async(self) -> Dict[str, Any]:
+        """
+        Serialize this embed like `Embed.to_dict()`.
+        Large embeds are serialized in the executor of `configure_offloading()`, not to block the event loop.
+        :return: json-serializable dictionary.
+        """
+        return await get_offloader().run(self.to_dict, size=self.estimate_size())
+
+    @classmethod
+    async def build(cls, builder: Callable[..., "Embed"], *args: Any, size_hint: Optional[int] = None) -> "Embed":
+        """
+        Run CPU-heavy embed builder (e.g. rendering tables into fields) in the executor of `configure_offloading()`.
+        :param builder: function building the embed. Must be picklable to use process executor.
+        :param args: arguments of the builder.
+        :param size_hint: estimated size of the embed. Builders estimated small run inline.
+        :return: built embed.
+        """
+        return await get_offloader().run(builder, *args, size=size_hint)
+
     def to_dict(self) -> Dict[str, Any]:
-        data: Dict[str, Union[str, Colour, Dict[str, Union[str, bool]], datetime]] = {
-            "title": self.title,
-            "type": self.type,
-            "color": self.color
+        """
+        Serialize this embed into discord`s embed structure.
+        :return: json-serializable dictionary.
+        """
+        data: Dict[str, Any] = {
+            "type": self.type.value,
+            "title": self.title
         }
+        if self.color is not None:
+            data["color"] = self.color.value
         if self.description:
             data["description"] = self.description
+        if self.url:
+            data["url"] = self.url
+        if self.timestamp:
+            data["timestamp"] = self.timestamp.isoformat()
         if self.author:
             data["author"] = self.author.toDict()
         if self.footer:
-            data["footer"] = self.footer.to_dict()
-        if self.timestamp:
-            data["timestamp"] = str(self.timestamp)
-        if self.url:
-            data["url"] = self.url
+            data["footer"] = self.footer.toDict()
         if self.thumbnail:
-            data["thumbnail"]
+            data["thumbnail"] = self.thumbnail.toDict()
         if self.image:
             data["image"] = self.image.toDict()
+        if self._provider:
+            data["provider"] = self._provider.toDict()
+        if self.fields:
+            data["fields"] = [field.toDict() for field in self.fields]
         return data
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Embed":
+        """
+        Construct embed object from discord`s embed structure. (Reverse operation of `Embed.to_dict()`)
+        :param data: dictionary of embed structure.
+        :return: Embed object.
+        """
+        if not isinstance(data, dict):
+            raise TypeError("Expected Dict[str, Any], caught {}".format(data.__class__))
+        timestamp = data.get("timestamp")
+        return cls(
+            embed_type=EmbedType.from_value(data.get("type") or "rich"),
+            title=data.get("title") or "",
+            url=data.get("url"),
+            description=data.get("description") or "",
+            color=process_color(data.get("color")),
+            timestamp=datetime.fromisoformat(timestamp) if isinstance(timestamp, str) else None,
+            author=data.get("author"),
+            footer=data.get("footer"),
+            thumbnail=data.get("thumbnail"),
+            image=data.get("image"),
+            provider=data.get("provider"),
+            fields=data.get("fields")
+        )
+
+    def estimate_size(self) -> int:
+        """
+        Estimate size of this embed, as the number of characters in its text properties.
+        :return: estimated size.
+        """
+        size = len(self.title) + len(self.description)
+        if self.author:
+            size += len(self.author.name)
+        if self.footer:
+            size += len(self.footer.text or "")
+        for field in self.fields:
+            size += len(field.name) + len(field.value)
+        return size
+
     @classmethod
     def LOG_EMBED(cls, title: str, description: str) -> "Embed":
         return Embed(
@@ -269,10 +322,19 @@ class Embed(DiscordEmbed):
         )
 
     @classmethod
-    def ERROR_EMBED(cls, title: str, e: Exception) -> "Embed":
+    def ERROR_EMBED(cls, title: str, e: Optional[BaseException], traceback_text: Optional[str] = None) -> "Embed":
+        """
+        Create embed presenting given exception.
+        :param title: title of the embed. Default title is used if empty.
+        :param e: exception to present. (Can be None if traceback_text is given)
+        :param traceback_text: already formatted traceback, to avoid formatting it again.
+        :return: Embed object.
+        """
+        if traceback_text is None:
+            traceback_text = format_traceback(e, ERROR_TRACEBACK_LIMIT)
         return Embed(
-            title="오류가 발생했습니다!",
-            description=f"Error content : \n{e.with_traceback(e.__traceback__)}",
+            title=title or "오류가 발생했습니다!",
+            description=f"{ERROR_DESCRIPTION_PREFIX}{traceback_text}{ERROR_DESCRIPTION_SUFFIX}",
             color=Colour.red()
         )
 
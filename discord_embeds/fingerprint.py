@@ -0,0 +1,67 @@
+import hashlib
+import traceback
+from typing import List
+
+"""
+Exception fingerprint
+________________________________________________________________________________________________
+Exceptions are identified by their type and the frames of their traceback. (file, function, line)
+Exception messages are excluded, so the same crash with different values shares its fingerprint.
+________________________________________________________________________________________________
+"""
+
+TRUNCATION_MARKER = "  ...\n"
+
+
+def fingerprint_exception(e: BaseException) -> str:
+    """
+    Calculate fingerprint of given exception without formatting its traceback.
+    :param e: exception to fingerprint.
+    :return: hex digest identifying exception type and traceback frames.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    exc_type = type(e)
+    digest.update("{}.{}".format(exc_type.__module__, exc_type.__qualname__).encode())
+    for frame, lineno in traceback.walk_tb(e.__traceback__):
+        code = frame.f_code
+        digest.update("\0{}\0{}\0{}".format(code.co_filename, code.co_name, lineno).encode())
+    return digest.hexdigest()
+
+
+def truncate_traceback(chunks: List[str], limit: int) -> str:
+    """
+    Join formatted traceback chunks within given length.
+    Keeps the header and the most recent frames with the exception message,
+    replacing the omitted frames with a marker.
+    :param chunks: result of `traceback.format_exception()`.
+    :param limit: maximum length of the result.
+    :return: truncated traceback text.
+    """
+    text = "".join(chunks)
+    if len(text) <= limit:
+        return text
+
+    header = chunks[0] if len(chunks) > 1 else ""
+    budget = limit - len(header) - len(TRUNCATION_MARKER)
+    tail: List[str] = []
+    for chunk in reversed(chunks[1:] if header else chunks):
+        if len(chunk) > budget:
+            break
+        tail.append(chunk)
+        budget -= len(chunk)
+
+    if not tail:
+        # Even the exception message does not fit : keep its end.
+        last = chunks[-1]
+        return last[-limit:]
+    return header + TRUNCATION_MARKER + "".join(reversed(tail))
+
+
+def format_traceback(e: BaseException, limit: int) -> str:
+    """
+    Format traceback of given exception within given length.
+    :param e: exception to format.
+    :param limit: maximum length of the result.
+    :return: formatted traceback text.
+    """
+    return truncate_traceback(traceback.format_exception(type(e), e, e.__traceback__), limit)
@@ -0,0 +1,285 @@
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
+from .exceptions import *
+from .objects import *
+from .embed import Embed
+
+"""
+FrozenEmbed
+________________________________________________________________________________________________
+Immutable & hashable variant of Embed.
+Every property (including sub-objects and fields) is immutable, so `FrozenEmbed.evolve()` creates
+a new embed sharing all untouched properties instead of copying them.
+FrozenEmbed can be passed across threads and tasks without copying.
+________________________________________________________________________________________________
+* Properties are processed like Embed`s, following the current validation policy. (See `validation_mode()`)
+"""
+
+
+class FrozenObject(Mapping):
+    """
+    Immutable form of embed property objects. (author, footer, thumbnail, image, provider)
+    Behaves like a read-only `EmbedObject.toDict()` result.
+    Known attributes of the original object, which are omitted from `toDict()` when unset, are None.
+    """
+
+    __slots__ = ("_data", "_attributes", "_hash")
+
+    # Class of embed object -> its attribute names, shared by every frozen object of the class.
+    _known_attributes: Dict[type, Tuple[str, ...]] = {}
+
+    def __init__(self, data: Dict[str, Any], attributes: Tuple[str, ...] = ()) -> None:
+        self._data = dict(data)
+        self._attributes = attributes
+        self._hash = None
+
+    @classmethod
+    def fromObject(cls, obj: Optional[EmbedObject]) -> Optional["FrozenObject"]:
+        if obj is None:
+            return None
+        attributes = cls._known_attributes.get(obj.__class__)
+        if attributes is None:
+            attributes = cls._known_attributes.setdefault(obj.__class__, tuple(vars(obj)))
+        return cls(obj.toDict(), attributes)
+
+    def toDict(self) -> Dict[str, Any]:
+        return dict(self._data)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __getattr__(self, key: str) -> Any:
+        if key.startswith("_"):
+            raise AttributeError(key)
+        try:
+            return self._data[key]
+        except KeyError:
+            if key in self._attributes:
+                return None
+            raise AttributeError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return "Embed.FrozenObject({})".format(self._data)
+
+
+class FrozenField(NamedTuple):
+    """
+    Immutable form of Field.
+    """
+    name: str
+    value: str
+    inline: bool = False
+
+    @classmethod
+    def fromField(cls, field: Union[Field, Dict[str, Union[str, bool]], "FrozenField"]) -> "FrozenField":
+        if isinstance(field, cls):
+            return field
+        field = Field.fromDict(field)
+        return cls(field.name, field.value, field.inline)
+
+    def toDict(self) -> Dict[str, Union[str, bool]]:
+        return {
+            "name": self.name,
+            "value": self.value,
+            "inline": self.inline
+        }
+
+
+"""
+Processes : Validate given value and convert it into its immutable form.
+"""
+
+
+def freeze_type(value: Union[str, EmbedType]) -> str:
+    return process_type(value).value
+
+
+def freeze_url(value: Optional[str]) -> Optional[str]:
+    return get_policy().optional_url(value, "url")
+
+
+def freeze_color(value: Union[Colour, int, str, None]) -> Optional[int]:
+    color = process_color(value)
+    return None if color is None else color.value
+
+
+def freeze_timestamp(value: Optional[datetime]) -> Optional[datetime]:
+    # Invalid timestamp is dropped, like `Embed.__init__()` does.
+    return value if isinstance(value, datetime) else None
+
+
+def object_freezer(cls) -> Callable[[Any], Optional[FrozenObject]]:
+    def freeze(value: Union[EmbedObject, Dict[str, Any], FrozenObject, None]) -> Optional[FrozenObject]:
+        if value is None or isinstance(value, FrozenObject):
+            return value
+        return FrozenObject.fromObject(process_object(cls, value))
+    return freeze
+
+
+def freeze_fields(value: Optional[Iterable[Union[Field, FrozenField, Dict[str, Any]]]]) -> Tuple[FrozenField, ...]:
+    fields = [field.toDict() if isinstance(field, FrozenField) else field for field in value or ()]
+    return tuple(FrozenField(field.name, field.value, field.inline) for field in process_fields(fields))
+
+
+class FrozenEmbed(object):
+    """
+    Immutable & hashable embed.
+    Use `FrozenEmbed.evolve()` to create modified embed.
+    """
+
+    __slots__ = ("type", "title", "description", "url", "color", "timestamp",
+                 "author", "footer", "thumbnail", "image", "provider", "fields", "_hash")
+
+    _processors: Dict[str, Callable[[Any], Any]] = {
+        "type": freeze_type,
+        "title": process_title,
+        "description": process_desc,
+        "url": freeze_url,
+        "color": freeze_color,
+        "timestamp": freeze_timestamp,
+        "author": object_freezer(AuthorObject),
+        "footer": object_freezer(FooterObject),
+        "thumbnail": object_freezer(ImageObject),
+        "image": object_freezer(ImageObject),
+        "provider": object_freezer(ProviderObject),
+        "fields": freeze_fields
+    }
+    _defaults: Dict[str, Any] = {
+        "type": EmbedType.RICH.value,
+        "title": "",
+        "description": "",
+        "url": None,
+        "color": Colour.blurple().value,
+        "timestamp": None,
+        "author": None,
+        "footer": None,
+        "thumbnail": None,
+        "image": None,
+        "provider": None,
+        "fields": ()
+    }
+
+    def __init__(self, **properties: Any) -> None:
+        for name, value in self._defaults.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_hash", None)
+        self._apply(properties)
+
+    def _apply(self, properties: Dict[str, Any]) -> None:
+        unexpected = {name: repr(value) for name, value in properties.items() if name not in self._processors}
+        if unexpected:
+            raise UnexpectedKwargsError(unexpected)
+        for name, value in properties.items():
+            object.__setattr__(self, name, self._processors[name](value))
+
+    @classmethod
+    def from_embed(cls, embed: Embed) -> "FrozenEmbed":
+        """
+        Freeze given embed object.
+        :param embed: Embed object to freeze.
+        :return: FrozenEmbed object.
+        """
+        return cls(
+            type=embed.type,
+            title=embed.title,
+            description=embed.description,
+            url=embed.url,
+            color=embed.color,
+            timestamp=embed.timestamp,
+            author=embed.author,
+            footer=embed.footer,
+            thumbnail=embed.thumbnail,
+            image=embed.image,
+            provider=embed._provider,
+            fields=embed.fields
+        )
+
+    def evolve(self, **changes: Any) -> "FrozenEmbed":
+        """
+        Create new embed with given changes. Untouched properties are shared with this embed.
+        :param changes: properties to change. (Same names as FrozenEmbed`s attributes)
+        :return: new FrozenEmbed object.
+        """
+        evolved = object.__new__(self.__class__)
+        for name in self._defaults:
+            object.__setattr__(evolved, name, getattr(self, name))
+        object.__setattr__(evolved, "_hash", None)
+        evolved._apply(changes)
+        return evolved
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize this embed into discord`s embed structure. (Same form as `Embed.to_dict()`)
+        :return: json-serializable dictionary.
+        """
+        data: Dict[str, Any] = {
+            "type": self.type,
+            "title": self.title
+        }
+        if self.color is not None:
+            data["color"] = self.color
+        if self.description:
+            data["description"] = self.description
+        if self.url:
+            data["url"] = self.url
+        if self.timestamp:
+            data["timestamp"] = self.timestamp.isoformat()
+        for name in ("author", "footer", "thumbnail", "image", "provider"):
+            obj = getattr(self, name)
+            if obj:
+                data[name] = obj.toDict()
+        if self.fields:
+            data["fields"] = [field.toDict() for field in self.fields]
+        return data
+
+    def thaw(self) -> Embed:
+        """
+        Create mutable Embed object from this embed.
+        :return: Embed object.
+        """
+        return Embed.from_dict(self.to_dict())
+
+    def _key(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self._defaults)
+
+    def __setattr__(self, key: str, value: Any) -> NoReturn:
+        raise AttributeError("FrozenEmbed is immutable. Use `FrozenEmbed.evolve()` instead.")
+
+    def __delattr__(self, key: str) -> NoReturn:
+        raise AttributeError("FrozenEmbed is immutable. Use `FrozenEmbed.evolve()` instead.")
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, FrozenEmbed):
+            return NotImplemented
+        return self is other or self._key() == other._key()
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash(self._key()))
+        return self._hash
+
+    def __reduce__(self):
+        return self.__class__._restore, (self._key(),)
+
+    @classmethod
+    def _restore(cls, key: Tuple[Any, ...]) -> "FrozenEmbed":
+        frozen = object.__new__(cls)
+        for name, value in zip(cls._defaults, key):
+            object.__setattr__(frozen, name, value)
+        object.__setattr__(frozen, "_hash", None)
+        return frozen
+
+    def __repr__(self) -> str:
+        return ("Embed.Frozen(title={},description={},fields={})"
+                .format(self.title, self.description, len(self.fields)))
@@ -0,0 +1,228 @@
+import asyncio
+import concurrent.futures
+import copy
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from .objects import *
+from .embed import Embed
+from .fingerprint import truncate_traceback
+
+"""
+EmbedLogHandler
+________________________________________________________________________________________________
+logging.Handler which sends log records to discord using `Embed.LOG_EMBED`/`Embed.WARN_EMBED`
+and error embeds.
+Records are formatted & queued without blocking the logging thread, and a background worker batches them
+into as few embeds as discord`s limits allow, grouped by level.
+Full embeds wait until a message is filled with them (or until the next flush), so each send carries
+as many embeds as a message allows.
+________________________________________________________________________________________________
+Level                  | Embed
+________________________________________________________________________________________________
+~ INFO                 | Embed.LOG_EMBED (gold)
+WARNING                | Embed.WARN_EMBED (orange)
+ERROR ~                | Embed with red color
+________________________________________________________________________________________________
+* Discord allows up to 10 embeds (and 6000 characters in total) per message.
+"""
+
+MESSAGE_EMBEDS_LIMIT = 10
+MESSAGE_CHARACTERS_LIMIT = 6000
+
+_FLUSH = object()
+_STOP = object()
+
+
+def error_log_embed(title: str, description: str) -> Embed:
+    return Embed(
+        title=title,
+        description=description,
+        color=Colour.red()
+    )
+
+
+class EmbedLogHandler(logging.Handler):
+    """
+    Batching log handler sending records as embeds.
+    `send` is called on the worker thread with list of embeds to send in a single message.
+    If `send` is coroutine function, it is scheduled on given event loop and awaited by the worker thread,
+    for up to `send_timeout` seconds. Send timed out is cancelled and treated as failed.
+    """
+
+    def __init__(
+            self,
+            send: Callable[[List[Embed]], Any],
+            level: int = logging.NOTSET,
+            loop: Optional[asyncio.AbstractEventLoop] = None,
+            flush_interval: float = 5.0,
+            max_records: int = 50,
+            max_queue_size: int = 10000,
+            title: str = "Log",
+            send_timeout: float = 30.0
+    ) -> None:
+        super().__init__(level)
+        if asyncio.iscoroutinefunction(send) and loop is None:
+            raise ValueError("Event loop must be given to use coroutine function as `send`.")
+        self.send = send
+        self.loop = loop
+        self.flush_interval = flush_interval
+        self.max_records = max_records
+        self.title = title
+        self.send_timeout = send_timeout
+        self.dropped = 0
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(max_queue_size)
+        # Pending lines of each embed factory, and the last record to report errors.
+        self._pending: Dict[Callable[[str, str], Embed], List[str]] = {}
+        self._pending_sizes: Dict[Callable[[str, str], Embed], int] = {}
+        # Full embeds waiting to be packed into a message.
+        self._ready: List[Embed] = []
+        self._ready_characters = 0
+        self._last_record: Optional[logging.LogRecord] = None
+        self._worker = threading.Thread(target=self._work, name="EmbedLogHandler", daemon=True)
+        self._worker.start()
+
+    @staticmethod
+    def factory(record: logging.LogRecord) -> Callable[[str, str], Embed]:
+        """
+        Select embed factory used to present given record.
+        :param record: log record.
+        :return: callable receiving title and description.
+        """
+        if record.levelno >= logging.ERROR:
+            return error_log_embed
+        if record.levelno >= logging.WARNING:
+            return Embed.WARN_EMBED
+        return Embed.LOG_EMBED
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Format given record on the calling thread, like `logging.handlers.QueueHandler.prepare()`.
+        Arguments and exception of the record are not kept, since they may change (or leak) until the worker sends it.
+        Message longer than the description limit is truncated. Tracebacks keep their most recent frames
+        and the exception message.
+        :param record: log record.
+        :return: copy of the record, whose message is already formatted.
+        """
+        message = self.format(record)
+        if len(message) > DESCRIPTION_LIMIT:
+            if record.exc_info or record.exc_text or record.stack_info:
+                message = truncate_traceback(message.splitlines(keepends=True), DESCRIPTION_LIMIT)
+            else:
+                message = message[:DESCRIPTION_LIMIT - 1] + "…"
+        record = copy.copy(record)
+        record.message = message
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        record.stack_info = None
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            prepared = self.prepare(record)
+        except Exception:
+            self.handleError(record)
+            return
+        try:
+            self._queue.put_nowait(prepared)
+        except queue.Full:
+            # Never block the logging thread. Dropped records are counted instead.
+            self.dropped += 1
+
+    def flush(self) -> None:
+        """
+        Request the worker to send pending records immediately.
+        """
+        try:
+            self._queue.put_nowait(_FLUSH)
+        except queue.Full:
+            pass
+
+    def close(self) -> None:
+        if self._worker.is_alive():
+            self._queue.put(_STOP)
+            self._worker.join()
+        super().close()
+
+    def _work(self) -> None:
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                self._flush_pending()
+                return
+            if item is _FLUSH:
+                self._flush_pending()
+            elif item is not None:
+                self._add(item)
+
+            if time.monotonic() >= deadline:
+                self._flush_pending()
+                deadline = time.monotonic() + self.flush_interval
+
+    def _add(self, record: logging.LogRecord) -> None:
+        line = record.msg
+        self._last_record = record
+        factory = self.factory(record)
+        lines = self._pending.setdefault(factory, [])
+        size = self._pending_sizes.get(factory, 0)
+        # Lines are joined with "\n", so every line except the first costs one more character.
+        if lines and (size + 1 + len(line) > DESCRIPTION_LIMIT or len(lines) >= self.max_records):
+            self._seal(factory)
+            lines = self._pending.setdefault(factory, [])
+            size = 0
+        self._pending_sizes[factory] = size + len(line) + (1 if lines else 0)
+        lines.append(line)
+
+    def _seal(self, factory: Callable[[str, str], Embed]) -> None:
+        """
+        Build embed of the pending lines of given factory, and queue it to be packed into a message.
+        """
+        lines = self._pending.pop(factory, None)
+        self._pending_sizes.pop(factory, None)
+        if not lines:
+            return
+        embed = factory(self.title, "\n".join(lines))
+        length = len(embed.title) + len(embed.description)
+        if self._ready and self._ready_characters + length > MESSAGE_CHARACTERS_LIMIT:
+            self._send_ready()
+        self._ready.append(embed)
+        self._ready_characters += length
+        if len(self._ready) >= MESSAGE_EMBEDS_LIMIT:
+            self._send_ready()
+
+    def _send_ready(self) -> None:
+        if not self._ready:
+            return
+        batch = self._ready
+        self._ready = []
+        self._ready_characters = 0
+        self._send(batch)
+
+    def _flush_pending(self) -> None:
+        for factory in list(self._pending):
+            self._seal(factory)
+        self._send_ready()
+
+    def _send(self, embeds: List[Embed]) -> None:
+        try:
+            if self.loop is not None and asyncio.iscoroutinefunction(self.send):
+                future = asyncio.run_coroutine_threadsafe(self.send(embeds), self.loop)
+                try:
+                    future.result(self.send_timeout)
+                except concurrent.futures.TimeoutError:
+                    future.cancel()
+                    raise
+            else:
+                self.send(embeds)
+        except Exception:
+            self.handleError(self._last_record)
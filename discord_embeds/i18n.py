@@ -0,0 +1,159 @@
+import threading
+from typing import Any, Dict, Optional
+from .cache import LRUCache
+from .embed import Embed
+from .template import EmbedTemplate, assign_copied, iter_text_properties
+
+"""
+Localized embeds
+________________________________________________________________________________________________
+Text properties of the embed (title, description, field names/values, footer text, author name)
+can reference keys of the message catalog, in the form of "$key".
+Use "$$" to write text starting with literal "$".
+Each locale is rendered & validated once, and the rendered payloads are cached by LRU.
+________________________________________________________________________________________________
+Locale fallback : "ko-KR" -> "ko" -> catalog`s fallback locale
+________________________________________________________________________________________________
+"""
+
+MESSAGE_KEY_PREFIX = "$"
+
+
+class MessageCatalog(object):
+    """
+    Messages of each locale, keyed by message key.
+    `version` is increased on every update, so localized embeds re-render their cached pages.
+    """
+
+    def __init__(self, messages: Optional[Dict[str, Dict[str, str]]] = None, fallback_locale: str = "en-US") -> None:
+        self.fallback_locale = fallback_locale
+        self.version = 0
+        self._messages: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+        for locale, locale_messages in (messages or {}).items():
+            self.update(locale, locale_messages)
+
+    def update(self, locale: str, messages: Dict[str, str]) -> None:
+        """
+        Add or replace messages of given locale.
+        :param locale: locale of the messages. (e.g. "en-US", "ko")
+        :param messages: dictionary of message key and message.
+        """
+        with self._lock:
+            merged = dict(self._messages.get(locale, {}))
+            merged.update(messages)
+            self._messages[locale] = merged
+            self.version += 1
+
+    def resolve_locale(self, locale: str) -> str:
+        """
+        Find locale available in this catalog, following the fallback chain.
+        :param locale: requested locale.
+        :return: available locale.
+        """
+        if locale in self._messages:
+            return locale
+        language = locale.split("-")[0]
+        if language in self._messages:
+            return language
+        return self.fallback_locale
+
+    def get(self, locale: str, key: str) -> str:
+        """
+        Get message of given key.
+        :param locale: requested locale.
+        :param key: message key.
+        :return: message text.
+        """
+        for candidate in (locale, locale.split("-")[0], self.fallback_locale):
+            messages = self._messages.get(candidate)
+            if messages is not None and key in messages:
+                return messages[key]
+        raise KeyError("Message key '{}' does not exist in locale '{}' nor fallback locale.".format(key, locale))
+
+    def __contains__(self, locale: str) -> bool:
+        return locale in self._messages
+
+    def __repr__(self) -> str:
+        return ("MessageCatalog(locales={},fallback_locale={},version={})"
+                .format(list(self._messages), self.fallback_locale, self.version))
+
+
+class LocalizedEmbed(object):
+    """
+    Embed referencing message keys, rendered once per locale.
+
+    Rendered payloads are cached and shared between calls, so they must be treated as read-only.
+    Use `LocalizedEmbed.render_embed()` to get a new mutable Embed object.
+    """
+
+    def __init__(self, embed: Embed, catalog: MessageCatalog, cache_size: int = 32) -> None:
+        if not isinstance(embed, Embed):
+            raise TypeError("Expected Embed, caught {}".format(embed.__class__))
+        self.catalog = catalog
+        self._payload: Dict[str, Any] = embed.to_dict()
+        self._slots = [
+            (path, text[len(MESSAGE_KEY_PREFIX):], limit)
+            for path, text, limit in iter_text_properties(self._payload)
+            if text.startswith(MESSAGE_KEY_PREFIX)
+        ]
+        self._cache = LRUCache(cache_size)
+        self._templates = LRUCache(cache_size)
+
+    @property
+    def cache(self) -> LRUCache:
+        return self._cache
+
+    def _localize(self, locale: str) -> Dict[str, Any]:
+        payload = dict(self._payload)
+        copied = set()
+        for path, key, limit in self._slots:
+            if key.startswith(MESSAGE_KEY_PREFIX):
+                # Escaped literal text. ("$$text" -> "$text")
+                text = key
+            else:
+                text = self.catalog.get(locale, key)
+            if len(text) > limit:
+                raise ValueError(
+                    "Localized embed property '{}' in locale '{}' must be lower than {} characters, "
+                    "but got {} characters.".format(".".join(str(k) for k in path), locale, limit, len(text))
+                )
+            assign_copied(payload, path, text, copied)
+        return payload
+
+    def render(self, locale: str) -> Dict[str, Any]:
+        """
+        Render payload of given locale.
+        :param locale: locale to render.
+        :return: rendered payload, in the form of `Embed.to_dict()`.
+        """
+        key = (self.catalog.resolve_locale(locale), self.catalog.version)
+        payload = self._cache.get(key)
+        if payload is None:
+            payload = self._localize(key[0])
+            self._cache.put(key, payload)
+        return payload
+
+    def render_embed(self, locale: str) -> Embed:
+        """
+        Render new embed object of given locale.
+        :param locale: locale to render.
+        :return: Embed object.
+        """
+        return Embed.from_dict(self.render(locale))
+
+    def template(self, locale: str) -> EmbedTemplate:
+        """
+        Get compiled template of given locale, to substitute `{placeholders}` of localized messages.
+        :param locale: locale to render.
+        :return: EmbedTemplate object.
+        """
+        key = (self.catalog.resolve_locale(locale), self.catalog.version)
+        template = self._templates.get(key)
+        if template is None:
+            template = EmbedTemplate(Embed.from_dict(self.render(locale)))
+            self._templates.put(key, template)
+        return template
+
+    def __repr__(self) -> str:
+        return "LocalizedEmbed(keys={},cache={})".format([key for _, key, _ in self._slots], self._cache)
@@ -0,0 +1,119 @@
+import mmap
+import os
+import struct
+from typing import Optional, Tuple
+from .cache import LRUCache
+
+"""
+Image dimension sniffing
+________________________________________________________________________________________________
+Reads width & height of images from their headers only, without decoding them.
+Files are memory-mapped, so only the pages containing headers are actually read from disk.
+Results are cached by (path, mtime, size), so modified files are sniffed again.
+________________________________________________________________________________________________
+Format  | Header
+________________________________________________________________________________________________
+PNG     | IHDR chunk
+GIF     | Logical screen descriptor
+WebP    | VP8 / VP8L / VP8X chunk
+JPEG    | First SOFn segment
+________________________________________________________________________________________________
+"""
+
+ImageSize = Tuple[int, int]
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# SOFn markers, except DHT(0xC4), JPG(0xC8) and DAC(0xCC) which share the range.
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# Markers without length field.
+JPEG_STANDALONE_MARKERS = frozenset(range(0xD0, 0xDA)) | {0x01}
+
+_size_cache = LRUCache(maxsize=4096)
+
+
+def sniff_png(data) -> Optional[ImageSize]:
+    if data[:8] != PNG_SIGNATURE or data[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", data[16:24])
+
+
+def sniff_gif(data) -> Optional[ImageSize]:
+    if data[:6] not in (b"GIF87a", b"GIF89a"):
+        return None
+    return struct.unpack("<HH", data[6:10])
+
+
+def sniff_webp(data) -> Optional[ImageSize]:
+    if data[:4] != b"RIFF" or data[8:12] != b"WEBP":
+        return None
+    chunk = data[12:16]
+    if chunk == b"VP8 " and data[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L" and data[20:21] == b"\x2f":
+        bits = struct.unpack("<I", data[21:25])[0]
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        # 24-bit little-endian fields, padded so truncated headers raise struct.error.
+        width, = struct.unpack("<I", data[24:27] + b"\x00")
+        height, = struct.unpack("<I", data[27:30] + b"\x00")
+        return width + 1, height + 1
+    return None
+
+
+def sniff_jpeg(data) -> Optional[ImageSize]:
+    if data[:2] != b"\xff\xd8":
+        return None
+    position = 2
+    end = len(data)
+    while position + 4 <= end:
+        if data[position] != 0xFF:
+            return None
+        marker = data[position + 1]
+        if marker == 0xFF:
+            # Fill byte.
+            position += 1
+            continue
+        if marker in JPEG_STANDALONE_MARKERS:
+            position += 2
+            continue
+        if marker in JPEG_SOF_MARKERS:
+            if position + 9 > end:
+                return None
+            height, width = struct.unpack(">HH", data[position + 5:position + 9])
+            return width, height
+        # Skip segment using its length. (includes length field itself)
+        position += 2 + struct.unpack(">H", data[position + 2:position + 4])[0]
+    return None
+
+
+SNIFFERS = (sniff_png, sniff_gif, sniff_webp, sniff_jpeg)
+
+
+def sniff_image_size(path: str) -> Optional[ImageSize]:
+    """
+    Read width & height of PNG/JPEG/GIF/WebP image from its header.
+    :param path: path of the image file.
+    :return: tuple of (width, height), or None if the format is not supported.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    size = _size_cache.get(key)
+    if size is not None:
+        return size or None
+
+    size = ()
+    if stat.st_size > 0:
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for sniffer in SNIFFERS:
+                try:
+                    size = sniffer(data)
+                except struct.error:
+                    # Truncated header.
+                    size = None
+                if size is not None:
+                    break
+    # Unsupported files are cached as empty tuple, to tell them apart from cache misses.
+    _size_cache.put(key, size or ())
+    return size or None
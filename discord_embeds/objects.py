@@ -6,8 +6,13 @@ from typing import Dict, Optional, List
 from datetime import datetime
 from enum import Enum
 from typing import Union, NoReturn
-from discord import Colour
-import re
+from discord import Colour, Member, User, ClientUser
+from .cache import LRUCache
+from .imaging import sniff_image_size
+from .validation import *
+import inspect
+import os
+import warnings
 
 """
 Embed Structure : https://discord.com/developers/docs/resources/channel#embed-object-embed-structure
@@ -63,13 +68,21 @@ author.name	 |   256 characters
 _______________________________________
 """
 
+TITLE_LIMIT = 256
+DESCRIPTION_LIMIT = 2048
+FIELDS_LIMIT = 25
+FIELD_NAME_LIMIT = 256
+FIELD_VALUE_LIMIT = 1024
+FOOTER_TEXT_LIMIT = 2048
+AUTHOR_NAME_LIMIT = 256
 
-# URL Validator
-def validate_url(value) -> bool:
-    return isinstance(value, str) and re.match("^https?", value)
+
+ANY_USER = Union[User, Member, ClientUser]
+
+# Cache of user-based objects : (object class, user id) -> ((avatar key, display name), object)
+_user_objects = LRUCache(maxsize=4096)
 
 
-@DeprecationWarning
 class EmbedType(Enum):
     RICH = "rich"
     IMAGE = "image"
@@ -127,11 +140,11 @@ class EmbedObject(object):
         raise NotImplementedError("Subclasses should implement the method!")
 
 
-@DeprecationWarning
 class EmptyObject(EmbedObject):
-    """Represents `empty` value in embed property."""
+    """Represents `empty` value in embed property. (Deprecated : use None instead)"""
 
     def __init__(self, property_name: str, optional: bool = False) -> None:
+        warnings.warn("EmptyObject is deprecated. Use None for empty embed property.", DeprecationWarning, stacklevel=2)
         self.property_name = property_name
         self.optional = optional
 
@@ -171,6 +184,45 @@ class EmptyObject(EmbedObject):
         return False
 
 
+def avatar_key(user: ANY_USER) -> Optional[str]:
+    """
+    Get key identifying user`s current avatar. (avatar hash, including member`s guild avatar)
+    """
+    avatar = getattr(user, "display_avatar", None) or getattr(user, "avatar", None)
+    # discord.py 2.x exposes avatar as an Asset, which has its hash as `key`.
+    return getattr(avatar, "key", avatar)
+
+
+def avatar_url(user: ANY_USER) -> str:
+    """
+    Get url of user`s current avatar, including default avatar.
+    """
+    asset = getattr(user, "display_avatar", None)
+    if asset is None:
+        asset = user.avatar_url
+    return str(asset)
+
+
+def cached_user_object(cls, user: ANY_USER, factory) -> EmbedObject:
+    """
+    Get shared object built from given user, rebuilding it only when the user`s avatar or name has changed.
+    Members are cached per guild, since their display name & avatar differ in each guild.
+    :param cls: class of the object, used as a part of cache key.
+    :param user: discord user or member.
+    :param factory: function building the object from the user.
+    :return: cached object.
+    """
+    guild = getattr(user, "guild", None)
+    key = (cls, user.id, getattr(guild, "id", None))
+    version = (avatar_key(user), user.display_name)
+    cached = _user_objects.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    obj = factory(user)
+    _user_objects.put(key, (version, obj))
+    return obj
+
+
 class AuthorObject(EmbedObject):
     """Represents author objects on discord Embed.
 
@@ -178,24 +230,25 @@ class AuthorObject(EmbedObject):
 
     def __init__(self, name: str, url: Optional[str] = None, icon_url: Optional[str] = None,
                  proxy_icon_url: Optional[str] = None):
-        if type(name) != str or len(name) > 256:
-            raise ValueError("Author Object cannot have name longer than 256.")
-        self.name = name
+        policy = get_policy()
+        self.name = policy.text(name, AUTHOR_NAME_LIMIT, "author.name",
+                                message="Author Object cannot have name longer than 256.")
+        self.url = None if url is None else policy.url(url, "url")
+        self.icon_url = None if icon_url is None else policy.url(icon_url, "icon url", allow_attachment=True)
+        self.proxy_icon_url = None if proxy_icon_url is None else policy.url(proxy_icon_url, "proxy icon url")
 
-        if url is not None and validate_url(url):
-            self.url = url
-        else:
-            raise ValueError("Invalid url!")
-
-        if icon_url is not None and validate_url(icon_url):
-            self.icon_url = icon_url
-        else:
-            raise ValueError("Invalid icon url!")
-
-        if proxy_icon_url is not None and validate_url(proxy_icon_url):
-            self.proxy_icon_url = proxy_icon_url
-        else:
-            raise ValueError("Invalid proxy icon url!")
+    @classmethod
+    def fromUser(cls, user: ANY_USER) -> AuthorObject:
+        """
+        Get author object presenting given user with display name and avatar.
+        Returned object is cached & shared until the user`s avatar or name changes, so do not modify it.
+        :param user: discord user or member.
+        :return: AuthorObject.
+        """
+        return cached_user_object(
+            cls, user,
+            lambda u: cls(name=u.display_name, icon_url=avatar_url(u))
+        )
 
     @classmethod
     def fromDict(cls, data: Union["AuthorObject", Dict[str, Any]]) -> AuthorObject:
@@ -242,12 +295,23 @@ class FooterObject(EmbedObject):
 
     def __init__(self, text: Optional[str], icon_url: Optional[str] = None,
                  proxy_icon_url: Optional[str] = None):
-        self.text = text
-        self.icon_url = icon_url if validate_url(icon_url) else None
-        self.proxy_icon_url = proxy_icon_url if validate_url(proxy_icon_url) else None
+        policy = get_policy()
+        self.text = None if text is None else policy.text(text, FOOTER_TEXT_LIMIT, "footer.text")
+        self.icon_url = policy.optional_url(icon_url, "footer icon url", allow_attachment=True)
+        self.proxy_icon_url = policy.optional_url(proxy_icon_url, "footer proxy icon url")
 
-        if proxy_icon_url is not None and validate_url(proxy_icon_url):
-            self.proxy_icon_url = proxy_icon_url
+    @classmethod
+    def fromUser(cls, user: ANY_USER) -> FooterObject:
+        """
+        Get footer object presenting given user with display name and avatar.
+        Returned object is cached & shared until the user`s avatar or name changes, so do not modify it.
+        :param user: discord user or member.
+        :return: FooterObject.
+        """
+        return cached_user_object(
+            cls, user,
+            lambda u: cls(text=u.display_name, icon_url=avatar_url(u))
+        )
 
     @classmethod
     def fromDict(cls, data: Dict[str, Any]) -> FooterObject:
@@ -296,19 +360,31 @@ class ImageObject(EmbedObject):
             height: Optional[int] = None,
             width: Optional[int] = None
     ) -> None:
-        if validate_url(url):
-            self.url = url
-        else:
-            raise ValueError("Invalid url!")
-
-        if validate_url(proxy_url):
-            self.proxy_url: Optional[str] = proxy_url
-        else:
-            self.proxy_url: Optional[str] = None
+        policy = get_policy()
+        # In lenient mode, object with dropped url is treated as empty. (See `__bool__`)
+        self.url: Optional[str] = policy.url(url, "url", message="Invalid url!", allow_attachment=True)
+        self.proxy_url: Optional[str] = policy.optional_url(proxy_url, "proxy url")
 
         self.height = height
         self.width = width
 
+    @classmethod
+    def fromFile(cls, path: str, filename: Optional[str] = None) -> ImageObject:
+        """
+        Construct image object referencing local file, which will be uploaded as an attachment.
+        Width and height are read from the image header. (PNG, JPEG, GIF, WebP)
+        :param path: path of the image file.
+        :param filename: filename of the attachment. (Default : name of the file)
+        :return: ImageObject with `attachment://` url.
+        """
+        size = sniff_image_size(path)
+        width, height = size if size is not None else (None, None)
+        return cls(
+            url=ATTACHMENT_SCHEME + (filename or os.path.basename(path)),
+            height=height,
+            width=width
+        )
+
     @classmethod
     def fromDict(cls, data: Dict[str, Any]) -> ImageObject:
         # Type Check
@@ -339,6 +415,9 @@ class ImageObject(EmbedObject):
         return ("Embed.Image(url={},proxy_url={},height={},width={}"
                 .format(self.url, self.proxy_url, self.height, self.width))
 
+    def __bool__(self) -> bool:
+        return self.url is not None
+
 
 # Alias (thumbnail and image objects shares same attributes.)
 ThumbnailObject = ImageObject
@@ -350,10 +429,7 @@ class VideoObject(EmbedObject):
     """
 
     def __init__(self, url: str, height: Optional[int] = None, width: Optional[int] = None):
-        if validate_url(url):
-            self.url = url
-        else:
-            raise ValueError("Invalid url!")
+        self.url: Optional[str] = get_policy().url(url, "url", message="Invalid url!")
 
         self.height = height
         self.width = width
@@ -390,6 +466,9 @@ class VideoObject(EmbedObject):
     def __repr__(self) -> str:
         return "Embed.Video(url={},height={},width={})".format(self.url, self.height, self.width)
 
+    def __bool__(self) -> bool:
+        return self.url is not None
+
 
 class ProviderObject(EmbedObject):
     """
@@ -440,43 +519,45 @@ class Field(EmbedObject):
     def __init__(self, name: str, value: str,
                  inline: Optional[bool] = False):
 
-        if not Field.check_name(name):
-            raise ValueError("")
-        self.name = name
-        if not Field.check_value(value):
-            raise ValueError("")
-        self.value = value
+        policy = get_policy()
+        self.name = name if Field.check_name(name) else policy.text(name, FIELD_NAME_LIMIT, "field.name")
+        self.value = value if Field.check_value(value) else policy.text(value, FIELD_VALUE_LIMIT, "field.value")
         if type(inline) != bool:
             inline = False
         self.inline = inline
 
+    @classmethod
+    def unchecked(cls, name: str, value: str, inline: Optional[bool] = False) -> Field:
+        """
+        Construct field without checking name and value. Use only with already validated data.
+        """
+        field = cls.__new__(cls)
+        field.name = name
+        field.value = value
+        field.inline = inline if type(inline) == bool else False
+        return field
+
     @classmethod
     def check_name(cls, name: str) -> bool:
-        return type(name) is str and len(name) <= 256
+        return type(name) is str and len(name) <= FIELD_NAME_LIMIT
 
     @classmethod
     def check_value(cls, value: str) -> bool:
-        return type(value) is str and len(value) <= 1024
+        return type(value) is str and len(value) <= FIELD_VALUE_LIMIT
 
     @classmethod
     def fromDict(cls, data: Union[Field, Dict[str, Union[str, bool]]]) -> Optional[Field]:
         if isinstance(data, cls):
             return data
         if data is None or not isinstance(data, dict):
-            raise TypeError("Expected Dict[str, Union[str, bool]], caught {}".format(data.__class__))
-        try:
-            name = data.get("name")
-            if not cls.check_name(name):
-                raise ValueError("")
-            value = data.get("value")
-            if not cls.check_value(value):
-                raise ValueError("")
-            inline = data.get("inline") or False
-            if type(inline) != bool:
-                raise TypeError("")
-        # Does not except ValueError&TypeError, because it is intentionally raised to indicate error on given data.
-        except KeyError as e:
-            raise ValueError(f"Invalid data is passed in VideoObject. : {data}. KeyError : {e}")
+            get_policy().invalid("Expected Dict[str, Union[str, bool]], caught {}".format(data.__class__), TypeError)
+            return None
+        inline = data.get("inline") or False
+        if type(inline) != bool:
+            get_policy().invalid("Field inline must be bool, caught {}".format(inline.__class__), TypeError)
+            inline = False
+        # Name & value are checked in `Field.__init__()`, following the validation policy.
+        return cls(name=data.get("name"), value=data.get("value"), inline=inline)
 
     def toDict(self) -> Dict[str, str]:
         result = {
@@ -518,10 +599,11 @@ class Field(EmbedObject):
         return itemIter()
 
 
-@NotImplemented
 class Fields(EmbedObject, list):
+    """Represents list of fields. (Deprecated : use List[Field] instead)"""
 
     def __init__(self, fields: List[Field]):
+        warnings.warn("Fields is deprecated. Use List[Field] for embed fields.", DeprecationWarning, stacklevel=2)
         super().__init__()
         self.fields = []
         for field in fields:
@@ -545,6 +627,56 @@ class Fields(EmbedObject, list):
         return self.fields[index]
 
 
+def process_object(cls, value: Union[EmbedObject, Dict[str, Any], None]) -> Optional[EmbedObject]:
+    """
+    Process embed property object from object itself or its dictionary form.
+    :param cls: subclass of EmbedObject to construct.
+    :param value: object, dictionary or None. (None means empty property)
+    :return: instance of `cls` or None.
+    """
+    if value is None or isinstance(value, cls):
+        return value
+    if not isinstance(value, dict):
+        get_policy().invalid("Expected {} or Dict[str, Any], caught {}".format(cls.__name__, value.__class__), TypeError)
+        return None
+    obj = cls.fromDict(value)
+    # Objects whose required url is dropped in lenient mode are empty.
+    return obj if obj else None
+
+
+def process_image(value: Union[ImageObject, Dict[str, Any], str, None]) -> Optional[ImageObject]:
+    """
+    Process image/thumbnail property from object, dictionary or url.
+    :param value: ImageObject, dictionary, url or None.
+    :return: ImageObject or None.
+    """
+    if isinstance(value, str):
+        image = ImageObject(url=value)
+        return image if image else None
+    return process_object(ImageObject, value)
+
+
+def process_fields(value: Optional[List[Union[Field, Dict[str, Any]]]]) -> List[Field]:
+    """
+    Process list of fields, checking discord`s limit of field count.
+    :param value: list of fields or their dictionary forms.
+    :return: list of Field objects.
+    """
+    fields = []
+    for field in map(Field.fromDict, value or ()):
+        if field is None:
+            continue
+        # Discord rejects fields with empty name or value, which lenient mode makes of None.
+        if not field.name or not field.value:
+            get_policy().invalid("Field name and value must not be empty, caught {!r}.".format(field.toDict()))
+            continue
+        fields.append(field)
+    if len(fields) > FIELDS_LIMIT:
+        get_policy().invalid("Embed cannot have more than {} fields, caught {}.".format(FIELDS_LIMIT, len(fields)))
+        del fields[FIELDS_LIMIT:]
+    return fields
+
+
 """
 Checks : Check value and return boolean value.
 Processes : Process proper object using checks.
@@ -553,22 +685,63 @@ Processes : Process proper object using checks.
 
 def check_title(value) -> bool:
     # Type Check
-    return type(value) == str and len(value) <= 256
+    return type(value) == str and len(value) <= TITLE_LIMIT
+
+
+def process_type(value: Union[str, EmbedType]) -> EmbedType:
+    try:
+        return EmbedType.from_value(value)
+    except (KeyError, ValueError) as e:
+        get_policy().invalid(e.args[0], e.__class__)
+        return EmbedType.RICH
+
+
+def process_color(value: Union[Colour, int, str, None]) -> Optional[Colour]:
+    """
+    Process color of the embed : Colour object, color code, or name of Colour`s classmethod. (e.g. "red")
+    Invalid color is replaced with the default color in lenient mode.
+    """
+    if value is None or isinstance(value, Colour):
+        return value
+    if type(value) == int and 0 <= value <= 0xFFFFFF:
+        return Colour(value)
+    if type(value) == str and not value.startswith("_"):
+        factory = getattr(Colour, value, None)
+        if inspect.ismethod(factory) and factory.__self__ is Colour:
+            try:
+                return factory()
+            except TypeError:
+                # Classmethods requiring arguments. (e.g. `Colour.from_rgb`)
+                pass
+
+    policy = get_policy()
+    if type(value) == str:
+        policy.invalid("Invalid color key is passed : {}".format(value))
+    elif policy.lenient:
+        policy.invalid("Embed color must be an instance of `discord.Colour`, caught {}".format(value.__class__))
+    else:
+        raise InvalidColorError(value)
+    return Colour.blurple()
 
 
 def process_title(value: str) -> Union[str, NoReturn]:
     if check_title(value):
         return value
-
-    raise ValueError("Embed title must be string object and its length must be lower than 256.")
+    return get_policy().text(
+        value, TITLE_LIMIT, "title",
+        message="Embed title must be string object and its length must be lower than 256."
+    )
 
 
 def check_desc(value) -> bool:
     # Type Check
-    return type(value) == str and len(value) <= 2048
+    return type(value) == str and len(value) <= DESCRIPTION_LIMIT
 
 
 def process_desc(value: str) -> str:
     if check_desc(value):
         return value
-    raise ValueError("Embed description must be string object and its length must be lower than 2048.")
+    return get_policy().text(
+        value, DESCRIPTION_LIMIT, "description",
+        message="Embed description must be string object and its length must be lower than 2048."
+    )
@@ -0,0 +1,76 @@
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+"""
+Offloading
+________________________________________________________________________________________________
+Runs CPU-heavy embed building & serialization in an executor, so large embeds do not block
+the event loop (and gateway heartbeats). Work estimated smaller than the threshold runs inline,
+because handing it to an executor costs more than doing it.
+________________________________________________________________________________________________
+* Size is estimated as the number of characters. (See `Embed.estimate_size()`)
+* Thread executors run the work with the caller`s context, so `validation_mode()` is kept.
+  Process executors require picklable work, and run it with default validation policy.
+________________________________________________________________________________________________
+"""
+
+T = TypeVar("T")
+
+DEFAULT_OFFLOAD_THRESHOLD = 4096
+
+
+class Offloader(object):
+    """
+    Runs work inline or in the executor, depending on its estimated size.
+    :param executor: thread or process executor. (None means the event loop`s default executor)
+    :param threshold: minimum estimated size to offload.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, threshold: int = DEFAULT_OFFLOAD_THRESHOLD) -> None:
+        self.executor = executor
+        self.threshold = threshold
+
+    def should_offload(self, size: Optional[int]) -> bool:
+        """
+        :param size: estimated size of the work. None means unknown, which is always offloaded.
+        """
+        return size is None or size >= self.threshold
+
+    async def run(self, func: Callable[..., T], *args: Any, size: Optional[int] = None) -> T:
+        """
+        Run given function inline or in the executor.
+        :param func: function to run.
+        :param args: arguments of the function.
+        :param size: estimated size of the work.
+        :return: result of the function.
+        """
+        if not self.should_offload(size):
+            return func(*args)
+        loop = asyncio.get_running_loop()
+        if isinstance(self.executor, ProcessPoolExecutor):
+            return await loop.run_in_executor(self.executor, functools.partial(func, *args))
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self.executor, functools.partial(context.run, func, *args))
+
+    def __repr__(self) -> str:
+        return "Offloader(executor={},threshold={})".format(self.executor, self.threshold)
+
+
+_offloader = Offloader()
+
+
+def get_offloader() -> Offloader:
+    return _offloader
+
+
+def configure_offloading(executor: Optional[Executor] = None, threshold: int = DEFAULT_OFFLOAD_THRESHOLD) -> Offloader:
+    """
+    Configure executor & threshold used by `Embed.convert()`, `Embed.to_dict_async()` and `Embed.build()`.
+    :return: new offloader.
+    """
+    global _offloader
+    _offloader = Offloader(executor, threshold)
+    return _offloader
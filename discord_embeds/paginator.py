@@ -0,0 +1,203 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, List, Optional, Union
+from .cache import LRUCache
+from .embed import Embed
+
+"""
+EmbedPaginator
+________________________________________________________________________________________________
+Lazy paginated embeds over sync/async iterators. (e.g. database cursors)
+Rows are pulled from the source only when a page is requested, and each page is rendered on demand.
+Rendered pages are kept in a bounded LRU cache, and the next page is prefetched in the background.
+________________________________________________________________________________________________
+* Rows are kept only for as many pages as the cache holds. Iterators cannot be rewound, so pass `reopen`
+  (function re-opening the source at given row offset) to revisit pages whose rows were evicted.
+* Sync iterators are pulled inline by default, since many cursors (e.g. sqlite3) must be used on the thread
+  which created them. Use `threaded=True` to pull them on a single thread dedicated to the paginator instead,
+  so blocking cursors do not stall the event loop.
+"""
+
+PageRenderer = Callable[[List[Any], int], Embed]
+Source = Union[Iterable[Any], AsyncIterable[Any]]
+
+
+class EmbedPaginator(object):
+    """
+    Paginator rendering pages of rows into embeds on demand.
+    :param source: sync or async iterable of rows.
+    :param render: function receiving rows of a page and its index, returning an Embed.
+    :param per_page: number of rows in a page.
+    :param cache_size: maximum number of rendered pages (and pages of rows) to keep.
+    :param max_cache_weight: maximum estimated size (characters) of rendered pages to keep.
+    :param prefetch: whether to prefetch next page in the background.
+    :param reopen: function receiving row offset, returning the source starting at the offset.
+                   Without it, pages whose rows were evicted cannot be rendered again.
+    :param threaded: whether to pull sync iterators on a dedicated thread instead of the event loop.
+    """
+
+    def __init__(
+            self,
+            source: Source,
+            render: PageRenderer,
+            per_page: int = 10,
+            cache_size: int = 16,
+            max_cache_weight: Optional[int] = None,
+            prefetch: bool = True,
+            reopen: Optional[Callable[[int], Source]] = None,
+            threaded: bool = False
+    ) -> None:
+        if per_page <= 0:
+            raise ValueError("per_page must be positive.")
+        self._iterator = self._open(source)
+        self.render = render
+        self.per_page = per_page
+        self.prefetch = prefetch
+        self.reopen = reopen
+        # Single worker : every pull of sync iterators happens on the same thread.
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="EmbedPaginator") if threaded else None
+
+        self._rows = LRUCache(maxsize=cache_size)
+        self._loaded = 0
+        self._exhausted = False
+        self._pages = LRUCache(
+            maxsize=cache_size,
+            max_weight=max_cache_weight,
+            weigher=Embed.estimate_size if max_cache_weight is not None else None
+        )
+        self._pull_task: Optional[asyncio.Future] = None
+        self._prefetch_task: Optional[asyncio.Future] = None
+
+    @property
+    def exhausted(self) -> bool:
+        return self._exhausted
+
+    @property
+    def page_count(self) -> Optional[int]:
+        """
+        Number of pages. None if the source is not exhausted yet.
+        """
+        return self._loaded if self._exhausted else None
+
+    @property
+    def cache(self) -> LRUCache:
+        return self._pages
+
+    @staticmethod
+    def _open(source: Source) -> Union[Iterator[Any], AsyncIterator[Any]]:
+        if isinstance(source, AsyncIterable):
+            return source.__aiter__()
+        return iter(source)
+
+    async def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call blocking function of the source, inline or on the dedicated thread.
+        """
+        if self._executor is None:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(func, *args))
+
+    def _take_sync(self, iterator: Iterator[Any]) -> List[Any]:
+        return list(islice(iterator, self.per_page))
+
+    async def _take(self, iterator: Union[Iterator[Any], AsyncIterator[Any]]) -> List[Any]:
+        if not isinstance(iterator, AsyncIterator):
+            return await self._call(self._take_sync, iterator)
+        rows = []
+        try:
+            while len(rows) < self.per_page:
+                rows.append(await iterator.__anext__())
+        except StopAsyncIteration:
+            pass
+        return rows
+
+    async def _pull_page(self) -> None:
+        rows = await self._take(self._iterator)
+        if rows:
+            self._rows.put(self._loaded, rows)
+            self._loaded += 1
+        if len(rows) < self.per_page:
+            self._exhausted = True
+
+    async def _reopen_page(self, page: int) -> List[Any]:
+        """
+        Pull rows of given page again, from the source re-opened at its offset.
+        """
+        if self.reopen is None:
+            raise IndexError("Rows of page {} are evicted, and the source cannot be re-opened. "
+                             "Pass `reopen` to revisit evicted pages.".format(page))
+        iterator = self._open(await self._call(self.reopen, page * self.per_page))
+        try:
+            return await self._take(iterator)
+        finally:
+            if hasattr(iterator, "aclose"):
+                await iterator.aclose()
+            elif hasattr(iterator, "close"):
+                await self._call(iterator.close)
+
+    async def _pull_until(self, page: int) -> bool:
+        """
+        Pull rows from the source until given page is loaded.
+        :return: True if the page exists.
+        """
+        while page >= self._loaded and not self._exhausted:
+            # Every caller waits for the single in-flight pull, which is shielded from cancellation
+            # so that rows already taken from the source are never lost.
+            if self._pull_task is None or self._pull_task.done():
+                self._pull_task = asyncio.ensure_future(self._pull_page())
+            await asyncio.shield(self._pull_task)
+        return page < self._loaded
+
+    async def _render(self, page: int) -> Optional[Embed]:
+        embed = self._pages.get(page)
+        if embed is None:
+            if not await self._pull_until(page):
+                return None
+            rows = self._rows.get(page)
+            if rows is None:
+                rows = await self._reopen_page(page)
+            embed = self.render(rows, page)
+            self._pages.put(page, embed)
+        return embed
+
+    async def _prefetch(self, page: int) -> None:
+        try:
+            await self._render(page)
+        except Exception:
+            # Prefetch is best-effort : errors are raised again when the page is actually requested.
+            pass
+
+    async def get_page(self, page: int) -> Embed:
+        """
+        Get rendered embed of given page.
+        :param page: index of the page. (starts from 0)
+        :return: Embed object of the page.
+        """
+        if page < 0:
+            raise IndexError("Page index must not be negative.")
+        embed = await self._render(page)
+        if embed is None:
+            raise IndexError("Page {} is out of range.".format(page))
+        if self.prefetch and not (self._exhausted and page + 1 >= self._loaded) and page + 1 not in self._pages:
+            if self._prefetch_task is None or self._prefetch_task.done():
+                self._prefetch_task = asyncio.ensure_future(self._prefetch(page + 1))
+        return embed
+
+    async def close(self) -> None:
+        """
+        Cancel pending prefetch task, and stop the dedicated thread.
+        """
+        if self._prefetch_task is not None and not self._prefetch_task.done():
+            self._prefetch_task.cancel()
+            try:
+                await self._prefetch_task
+            except asyncio.CancelledError:
+                pass
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def __repr__(self) -> str:
+        return ("EmbedPaginator(per_page={},loaded_pages={},exhausted={},cache={})"
+                .format(self.per_page, self._loaded, self._exhausted, self._pages))
@@ -0,0 +1,270 @@
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import Any, Dict, Iterator, Optional, Union
+from .embed import Embed
+from .frozen import FrozenEmbed
+
+"""
+EmbedStore
+________________________________________________________________________________________________
+Append-only on-disk store of serialized embeds, indexed by message id.
+Records are read through a memory map, and deserialized into Embed only when requested.
+Replaced & deleted records remain in the file until `EmbedStore.compact()` rewrites it.
+________________________________________________________________________________________________
+File layout
+________________________________________________________________________________________________
+header   | 8 bytes   | magic "DPYEMBS2"
+record   | 8 bytes   | message id (unsigned, little endian)
+         | 4 bytes   | payload length (0 means the message is deleted)
+         | 4 bytes   | crc32 of the payload
+         | 4 bytes   | crc32 of the above 16 bytes
+         | n bytes   | payload (`Embed.to_dict()` as utf-8 json)
+________________________________________________________________________________________________
+* Only the offset of each message`s latest record is kept in memory.
+* Incomplete record at the end of the file (e.g. after a crash) is truncated when opening the store.
+  Corrupted record followed by other records raises ValueError instead, since truncating it would lose them.
+* Payload checksum is verified when opening the store for the last record only, and for others when read.
+"""
+
+MAGIC = b"DPYEMBS2"
+RECORD_HEADER = struct.Struct("<QIII")
+# Part of the record header covered by its own checksum.
+RECORD_PREFIX = struct.Struct("<QII")
+
+
+class EmbedStore(object):
+    """
+    Thread-safe disk-backed store of embeds, keyed by message id.
+    :param path: path of the store file. Created if it does not exist.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._index: Dict[int, int] = {}
+        self._garbage = 0
+        self._lock = threading.RLock()
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._open()
+
+    def _open(self) -> None:
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            with open(self.path, "wb") as file:
+                file.write(MAGIC)
+        self._file = open(self.path, "r+b")
+        if self._file.read(len(MAGIC)) != MAGIC:
+            self._file.close()
+            raise ValueError("{} is not an embed store file.".format(self.path))
+        self._remap()
+        self._load_index()
+        self._file.seek(0, os.SEEK_END)
+
+    def _remap(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _valid_header(self, offset: int) -> bool:
+        header_crc = RECORD_HEADER.unpack_from(self._map, offset)[3]
+        return zlib.crc32(self._map[offset:offset + RECORD_PREFIX.size]) == header_crc
+
+    def _valid_payload(self, offset: int) -> bool:
+        length, payload_crc = RECORD_HEADER.unpack_from(self._map, offset)[1:3]
+        start = offset + RECORD_HEADER.size
+        return zlib.crc32(self._map[start:start + length]) == payload_crc
+
+    def _is_torn_tail(self, offset: int) -> bool:
+        """
+        Check whether the bad record at given offset is the last record of the file, written partially.
+        """
+        end = len(self._map)
+        if offset + RECORD_HEADER.size > end or self._valid_header(offset):
+            # Valid header means the record reaches the end of the file.
+            return True
+        # Space allocated but never written by the crashed process is zero-filled.
+        return not any(self._map[offset:end])
+
+    def _load_index(self) -> None:
+        index: Dict[int, int] = {}
+        garbage = 0
+        data = self._map
+        offset = len(MAGIC)
+        end = len(data)
+        while offset + RECORD_HEADER.size <= end and self._valid_header(offset):
+            message_id, length = RECORD_HEADER.unpack_from(data, offset)[:2]
+            next_offset = offset + RECORD_HEADER.size + length
+            if next_offset > end or (next_offset == end and not self._valid_payload(offset)):
+                break
+            previous = index.pop(message_id, None)
+            if previous is not None:
+                garbage += RECORD_HEADER.size + RECORD_HEADER.unpack_from(data, previous)[1]
+            if length:
+                index[message_id] = offset
+            else:
+                garbage += RECORD_HEADER.size
+            offset = next_offset
+
+        if offset != end:
+            if not self._is_torn_tail(offset):
+                self.close()
+                raise ValueError("{} is corrupted at offset {}.".format(self.path, offset))
+            # Drop incomplete record written partially.
+            self._map.close()
+            self._map = None
+            self._file.truncate(offset)
+            self._remap()
+        self._index = index
+        self._garbage = garbage
+
+    def _append(self, message_id: int, payload: bytes) -> int:
+        offset = self._file.seek(0, os.SEEK_END)
+        prefix = RECORD_PREFIX.pack(message_id, len(payload), zlib.crc32(payload))
+        self._file.write(prefix + struct.pack("<I", zlib.crc32(prefix)))
+        self._file.write(payload)
+        previous = self._index.pop(message_id, None)
+        if previous is not None:
+            self._garbage += RECORD_HEADER.size + self._record_length(previous)
+        return offset
+
+    def _record_length(self, offset: int) -> int:
+        if offset + RECORD_HEADER.size > len(self._map):
+            self._file.flush()
+            self._remap()
+        return RECORD_HEADER.unpack_from(self._map, offset)[1]
+
+    @staticmethod
+    def serialize(embed: Union[Embed, FrozenEmbed, Dict[str, Any]]) -> bytes:
+        payload = embed if isinstance(embed, dict) else embed.to_dict()
+        return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def put(self, message_id: int, embed: Union[Embed, FrozenEmbed, Dict[str, Any]]) -> None:
+        """
+        Store current embed of the message, replacing the previous one.
+        :param message_id: id of the message.
+        :param embed: embed or its serialized form.
+        """
+        payload = self.serialize(embed)
+        if not payload:
+            raise ValueError("Serialized embed cannot be empty.")
+        with self._lock:
+            self._index[message_id] = self._append(message_id, payload)
+
+    def delete(self, message_id: int) -> bool:
+        """
+        Delete embed of the message.
+        :return: True if the message existed.
+        """
+        with self._lock:
+            if message_id not in self._index:
+                return False
+            self._append(message_id, b"")
+            self._garbage += RECORD_HEADER.size
+            return True
+
+    def get_raw(self, message_id: int) -> Optional[bytes]:
+        """
+        Get serialized embed of the message, without deserializing it.
+        :raise ValueError: if the record is corrupted.
+        """
+        with self._lock:
+            offset = self._index.get(message_id)
+            if offset is None:
+                return None
+            length = self._record_length(offset)
+            start = offset + RECORD_HEADER.size
+            if start + length > len(self._map):
+                self._file.flush()
+                self._remap()
+            raw = self._map[start:start + length]
+            if zlib.crc32(raw) != RECORD_HEADER.unpack_from(self._map, offset)[2]:
+                raise ValueError("Record of message {} is corrupted.".format(message_id))
+            return raw
+
+    def get_payload(self, message_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get embed of the message in the form of `Embed.to_dict()`.
+        """
+        raw = self.get_raw(message_id)
+        return None if raw is None else json.loads(raw)
+
+    def get(self, message_id: int) -> Optional[Embed]:
+        """
+        Get embed of the message, deserialized into Embed object.
+        """
+        payload = self.get_payload(message_id)
+        return None if payload is None else Embed.from_dict(payload)
+
+    @property
+    def garbage_ratio(self) -> float:
+        """
+        Ratio of bytes occupied by replaced & deleted records, which `EmbedStore.compact()` reclaims.
+        """
+        with self._lock:
+            size = self._file.seek(0, os.SEEK_END)
+            return self._garbage / size if size else 0.0
+
+    def compact(self) -> None:
+        """
+        Rewrite the store file with the latest records of live messages only.
+        """
+        with self._lock:
+            self._file.flush()
+            self._remap()
+            temp_path = self.path + ".compact"
+            index: Dict[int, int] = {}
+            with open(temp_path, "wb") as temp:
+                temp.write(MAGIC)
+                offset = len(MAGIC)
+                for message_id, old_offset in self._index.items():
+                    length = RECORD_HEADER.unpack_from(self._map, old_offset)[1]
+                    record = self._map[old_offset:old_offset + RECORD_HEADER.size + length]
+                    temp.write(record)
+                    index[message_id] = offset
+                    offset += len(record)
+                temp.flush()
+                os.fsync(temp.fileno())
+
+            self._map.close()
+            self._map = None
+            self._file.close()
+            os.replace(temp_path, self.path)
+            self._file = open(self.path, "r+b")
+            self._file.seek(0, os.SEEK_END)
+            self._remap()
+            self._index = index
+            self._garbage = 0
+
+    def flush(self) -> None:
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "EmbedStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __contains__(self, message_id: int) -> bool:
+        return message_id in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(list(self._index))
+
+    def __repr__(self) -> str:
+        return "EmbedStore(path={},messages={},garbage={})".format(self.path, len(self._index), self._garbage)
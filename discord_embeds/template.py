@@ -0,0 +1,182 @@
+import re
+from string import Formatter
+from typing import Any, Dict, Iterator, List, Set, Tuple, Union
+from .objects import *
+from .embed import Embed
+
+"""
+EmbedTemplate
+________________________________________________________________________________________________
+Embed with `{placeholders}` in its text properties, compiled once and rendered many times.
+Static parts of the template are validated & serialized when compiling the template,
+so rendering only substitutes (and checks limits of) the properties containing placeholders.
+Use `{{` and `}}` for literal braces, in every templatable property.
+________________________________________________________________________________________________
+Templatable property  | Limit
+________________________________________________________________________________________________
+title                 | 256 characters
+description           | 2048 characters
+fields[].name         | 256 characters
+fields[].value        | 1024 characters
+footer.text           | 2048 characters
+author.name           | 256 characters
+________________________________________________________________________________________________
+"""
+
+PayloadPath = Tuple[Union[str, int], ...]
+
+_formatter = Formatter()
+
+
+def placeholder_names(text: str) -> Iterator[str]:
+    """
+    Iterate over names of the `{placeholders}` in given text.
+    :param text: text to parse.
+    :return: iterator of placeholder names.
+    :raise ValueError: if text contains positional placeholder (e.g. `{}`, `{0}`), which cannot be rendered.
+    """
+    for _, field_name, _, _ in _formatter.parse(text):
+        if field_name is None:
+            continue
+        name = re.split(r"[.\[]", field_name, 1)[0]
+        if not name or name.isdigit():
+            raise ValueError("Template placeholders must be named, but got '{{{}}}' in '{}'. "
+                             "(Use `{{{{` and `}}}}` for literal braces)".format(field_name, text))
+        yield field_name
+
+
+def has_placeholder(text: Any) -> bool:
+    """
+    Check whether given text contains any `{placeholder}`.
+    :param text: text to check.
+    :return: True if text contains at least one replacement field.
+    :raise ValueError: if text contains positional placeholder.
+    """
+    if type(text) != str or "{" not in text:
+        return False
+    return any(True for _ in placeholder_names(text))
+
+
+def iter_text_properties(payload: Dict[str, Any]) -> Iterator[Tuple[PayloadPath, str, int]]:
+    """
+    Iterate over text properties of serialized embed, which have character limits.
+    :param payload: result of `Embed.to_dict()`.
+    :return: iterator of (path, text, limit)
+    """
+    for key, limit in (("title", TITLE_LIMIT), ("description", DESCRIPTION_LIMIT)):
+        if type(payload.get(key)) == str:
+            yield (key,), payload[key], limit
+    for key, sub_key, limit in (("footer", "text", FOOTER_TEXT_LIMIT), ("author", "name", AUTHOR_NAME_LIMIT)):
+        obj = payload.get(key)
+        if obj is not None and type(obj.get(sub_key)) == str:
+            yield (key, sub_key), obj[sub_key], limit
+    for index, field in enumerate(payload.get("fields", ())):
+        yield ("fields", index, "name"), field["name"], FIELD_NAME_LIMIT
+        yield ("fields", index, "value"), field["value"], FIELD_VALUE_LIMIT
+
+
+def assign_copied(payload: Dict[str, Any], path: PayloadPath, value: Any, copied: Set[PayloadPath]) -> None:
+    """
+    Assign value at given path of shallow-copied payload, copying containers on the path only once.
+    :param payload: shallow copy of the original payload.
+    :param path: path of the property to assign.
+    :param value: value to assign.
+    :param copied: set of paths of containers already copied. Updated by this function.
+    """
+    container = payload
+    for depth, key in enumerate(path[:-1]):
+        prefix = path[:depth + 1]
+        if prefix not in copied:
+            child = container[key]
+            container[key] = list(child) if isinstance(child, list) else dict(child)
+            copied.add(prefix)
+        container = container[key]
+    container[path[-1]] = value
+
+
+class TemplateSlot(object):
+    """
+    Represents a single property of the template which contains placeholders.
+    """
+
+    __slots__ = ("path", "text", "limit")
+
+    def __init__(self, path: PayloadPath, text: str, limit: int) -> None:
+        self.path = path
+        self.text = text
+        self.limit = limit
+
+    def render(self, values: Dict[str, Any]) -> str:
+        result = self.text.format_map(values)
+        if len(result) > self.limit:
+            raise ValueError(
+                "Rendered embed property '{}' must be lower than {} characters, but got {} characters."
+                .format(".".join(str(key) for key in self.path), self.limit, len(result))
+            )
+        return result
+
+    def __repr__(self) -> str:
+        return "EmbedTemplate.Slot(path={},text={},limit={})".format(self.path, self.text, self.limit)
+
+
+class EmbedTemplate(object):
+    """
+    Pre-compiled embed, which renders new payloads by substituting `{placeholders}` only.
+
+    Rendered payloads share the untouched parts (footer, author, fields without placeholders, ...)
+    with the template itself, so they must be treated as read-only.
+    """
+
+    def __init__(self, embed: Embed) -> None:
+        if not isinstance(embed, Embed):
+            raise TypeError("Expected Embed, caught {}".format(embed.__class__))
+        # Embed itself already validated static parts, so serialize them only once.
+        self._payload: Dict[str, Any] = embed.to_dict()
+        self._slots: List[TemplateSlot] = []
+        copied = set()
+        for path, text, limit in list(iter_text_properties(self._payload)):
+            if has_placeholder(text):
+                self._slots.append(TemplateSlot(path, text, limit))
+            elif "{" in text or "}" in text:
+                # Unescape `{{` and `}}` of static text, as rendering does for the slots.
+                assign_copied(self._payload, path, text.format_map({}), copied)
+
+    @property
+    def slots(self) -> List[TemplateSlot]:
+        return self._slots
+
+    @property
+    def placeholders(self) -> List[str]:
+        """
+        Names of the placeholders used in this template.
+        :return: list of placeholder names, in order of appearance.
+        """
+        names = []
+        for slot in self._slots:
+            for field_name in placeholder_names(slot.text):
+                if field_name not in names:
+                    names.append(field_name)
+        return names
+
+    def render(self, **values: Any) -> Dict[str, Any]:
+        """
+        Render new embed payload by substituting placeholders.
+        :param values: values of the placeholders.
+        :return: rendered payload, in the form of `Embed.to_dict()`.
+        """
+        payload = dict(self._payload)
+        copied = set()
+        for slot in self._slots:
+            assign_copied(payload, slot.path, slot.render(values), copied)
+        return payload
+
+    def render_embed(self, **values: Any) -> Embed:
+        """
+        Render new embed object by substituting placeholders.
+        :param values: values of the placeholders.
+        :return: Embed object.
+        """
+        return Embed.from_dict(self.render(**values))
+
+    def __repr__(self) -> str:
+        return "EmbedTemplate(placeholders={})".format(self.placeholders)
@@ -0,0 +1,166 @@
+import re
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Deque, Iterator, Optional, Type
+
+"""
+Validation policy
+________________________________________________________________________________________________
+Embed & embed objects validate their properties using the current validation policy.
+________________________________________________________________________________________________
+Mode     | On invalid property
+________________________________________________________________________________________________
+STRICT   | Raise exception. (default)
+LENIENT  | Truncate text to its limit (with ellipsis), drop invalid url,
+         | and record a warning in `ValidationPolicy.warnings` instead of raising.
+________________________________________________________________________________________________
+* Only the latest `max_warnings` warnings are kept, while `ValidationPolicy.warning_count` counts all of them.
+  (Long-living policies, such as the default policy, would grow forever otherwise)
+________________________________________________________________________________________________
+* Use `validation_mode()` to change the policy of the current context (thread / asyncio task),
+  or `set_default_policy()` to change the policy used everywhere else.
+"""
+
+ATTACHMENT_SCHEME = "attachment://"
+HTTP_URL_PATTERN = re.compile("^https?://")
+
+
+# URL Validator
+def validate_url(value, allow_attachment: bool = False) -> bool:
+    """
+    Check given value is http(s) url, or `attachment://` url referencing uploaded file.
+    :param allow_attachment: whether to accept `attachment://` url.
+                             Discord resolves it in image & thumbnail url, and author & footer icon url only.
+    """
+    if not isinstance(value, str):
+        return False
+    if allow_attachment and value.startswith(ATTACHMENT_SCHEME):
+        return True
+    return HTTP_URL_PATTERN.match(value) is not None
+
+
+class ValidationMode(Enum):
+    STRICT = "strict"
+    LENIENT = "lenient"
+
+
+class ValidationPolicy(object):
+    """
+    Decides how invalid properties are handled.
+    :param mode: validation mode.
+    :param ellipsis: text appended to truncated text. (LENIENT mode only)
+    :param max_warnings: maximum number of latest warnings to keep.
+    """
+
+    def __init__(self, mode: ValidationMode = ValidationMode.STRICT, ellipsis: str = "…",
+                 max_warnings: int = 100) -> None:
+        self.mode = mode
+        self.ellipsis = ellipsis
+        self.warnings: Deque[str] = deque(maxlen=max_warnings)
+        self.warning_count = 0
+
+    @property
+    def lenient(self) -> bool:
+        return self.mode == ValidationMode.LENIENT
+
+    def warn(self, message: str) -> None:
+        self.warning_count += 1
+        self.warnings.append(message)
+
+    def invalid(self, message: str, exc_type: Type[Exception] = ValueError) -> None:
+        """
+        Report invalid property : raise in STRICT mode, record a warning in LENIENT mode.
+        """
+        if not self.lenient:
+            raise exc_type(message)
+        self.warn(message)
+
+    def text(self, value: Any, limit: int, name: str, message: Optional[str] = None) -> str:
+        """
+        Validate text property.
+        :param value: value to validate.
+        :param limit: maximum length of the text.
+        :param name: name of the property, used in messages.
+        :param message: message of the exception raised in STRICT mode.
+        :return: valid text. (truncated in LENIENT mode)
+        """
+        if type(value) == str and len(value) <= limit:
+            return value
+        if not self.lenient:
+            raise ValueError(message or "Embed {} must be string object and its length must be lower than {}."
+                             .format(name, limit))
+        if type(value) != str:
+            self.warn("Embed {} must be string object, caught {}.".format(name, value.__class__))
+            value = "" if value is None else str(value)
+            if len(value) <= limit:
+                return value
+        self.warn("Embed {} is truncated from {} to {} characters.".format(name, len(value), limit))
+        ellipsis = self.ellipsis[:limit]
+        return value[:limit - len(ellipsis)] + ellipsis
+
+    def url(self, value: Any, name: str, message: Optional[str] = None, allow_attachment: bool = False) -> Optional[str]:
+        """
+        Validate url property, which raises exception in STRICT mode if invalid.
+        :param allow_attachment: whether to accept `attachment://` url. (See `validate_url()`)
+        :return: valid url, or None if it is dropped. (LENIENT mode only)
+        """
+        if validate_url(value, allow_attachment):
+            return value
+        self.invalid(message or "Invalid {}!".format(name))
+        return None
+
+    def optional_url(self, value: Any, name: str, allow_attachment: bool = False) -> Optional[str]:
+        """
+        Validate url property, which is silently dropped in STRICT mode if invalid.
+        :param allow_attachment: whether to accept `attachment://` url. (See `validate_url()`)
+        :return: valid url, or None.
+        """
+        if value is None or validate_url(value, allow_attachment):
+            return value
+        if self.lenient:
+            self.warn("Invalid {} is dropped : {}".format(name, value))
+        return None
+
+    def __repr__(self) -> str:
+        return ("ValidationPolicy(mode={},ellipsis={},warnings={})"
+                .format(self.mode.value, self.ellipsis, self.warning_count))
+
+
+_default_policy = ValidationPolicy()
+_current_policy: ContextVar[Optional[ValidationPolicy]] = ContextVar("discord_embeds_validation_policy", default=None)
+
+
+def get_policy() -> ValidationPolicy:
+    """
+    Get validation policy of the current context.
+    """
+    return _current_policy.get() or _default_policy
+
+
+def set_default_policy(policy: ValidationPolicy) -> None:
+    """
+    Set validation policy used outside of `validation_mode()` blocks.
+    """
+    global _default_policy
+    _default_policy = policy
+
+
+@contextmanager
+def validation_mode(mode: ValidationMode = ValidationMode.LENIENT, ellipsis: str = "…",
+                    max_warnings: int = 100) -> Iterator[ValidationPolicy]:
+    """
+    Use new validation policy in the current context.
+    Warnings recorded in the block are collected in the yielded policy.
+
+    with validation_mode() as policy:
+        embed = Embed(title=very_long_title)
+    print(policy.warnings)
+    """
+    policy = ValidationPolicy(mode, ellipsis, max_warnings)
+    token = _current_policy.set(policy)
+    try:
+        yield policy
+    finally:
+        _current_policy.reset(token)
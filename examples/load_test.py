@@ -0,0 +1,333 @@
+"""
+Load test harness
+-----------------
+Measures throughput of building, serializing and sending embeds against a local fake discord API.
+
+Usage : python -m examples.load_test --workload send --count 10000 --concurrency 8 --fields 10
+
+Fake API
+________________________________________________________________________________________________
+POST /api/v{version}/channels/{channel_id}/messages
+POST /api/v{version}/webhooks/{webhook_id}/{webhook_token}
+________________________________________________________________________________________________
+* Payloads are validated against discord`s embed limits. (400 on violation)
+* Each route has its own rate limit bucket, reported with `X-RateLimit-*` headers. (429 when exhausted)
+"""
+
+import argparse
+import http.client
+import json
+import math
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from discord_embeds import (
+    Embed, AuthorObject, FooterObject, Field,
+    TITLE_LIMIT, DESCRIPTION_LIMIT, FIELDS_LIMIT, FIELD_NAME_LIMIT, FIELD_VALUE_LIMIT,
+    FOOTER_TEXT_LIMIT, AUTHOR_NAME_LIMIT, MESSAGE_EMBEDS_LIMIT, MESSAGE_CHARACTERS_LIMIT
+)
+
+WORKLOADS = ("build", "serialize", "send")
+ROUTE_PATTERN = re.compile(r"^/api/v\d+/(channels/(\d+)/messages|webhooks/(\d+)/[\w-]+)$")
+
+
+def validate_payload(payload: Any) -> Optional[str]:
+    """
+    Validate message payload like discord does.
+    :return: error message, or None if the payload is valid.
+    """
+    if not isinstance(payload, dict):
+        return "Payload must be an object."
+    embeds = payload.get("embeds", [])
+    if not isinstance(embeds, list) or len(embeds) > MESSAGE_EMBEDS_LIMIT:
+        return "Message cannot have more than {} embeds.".format(MESSAGE_EMBEDS_LIMIT)
+    if not embeds and not payload.get("content"):
+        return "Cannot send an empty message."
+
+    total = 0
+    for index, embed in enumerate(embeds):
+        texts: List[Tuple[str, Any, int]] = [
+            ("title", embed.get("title", ""), TITLE_LIMIT),
+            ("description", embed.get("description", ""), DESCRIPTION_LIMIT),
+            ("footer.text", (embed.get("footer") or {}).get("text", ""), FOOTER_TEXT_LIMIT),
+            ("author.name", (embed.get("author") or {}).get("name", ""), AUTHOR_NAME_LIMIT)
+        ]
+        fields = embed.get("fields", [])
+        if len(fields) > FIELDS_LIMIT:
+            return "embeds.{}.fields : Must be {} or fewer in length.".format(index, FIELDS_LIMIT)
+        for field_index, field in enumerate(fields):
+            texts.append(("fields.{}.name".format(field_index), field.get("name"), FIELD_NAME_LIMIT))
+            texts.append(("fields.{}.value".format(field_index), field.get("value"), FIELD_VALUE_LIMIT))
+        for name, text, limit in texts:
+            if text is None:
+                continue
+            if not isinstance(text, str):
+                return "embeds.{}.{} : Must be a string.".format(index, name)
+            if len(text) > limit:
+                return "embeds.{}.{} : Must be {} or fewer in length.".format(index, name, limit)
+            total += len(text)
+    if total > MESSAGE_CHARACTERS_LIMIT:
+        return "Embed size exceeds maximum size of {}".format(MESSAGE_CHARACTERS_LIMIT)
+    return None
+
+
+class RateLimiter(object):
+    """
+    Fixed window rate limiter of each bucket.
+    """
+
+    def __init__(self, limit: int, window: float) -> None:
+        self.limit = limit
+        self.window = window
+        self._buckets: Dict[str, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def hit(self, bucket: str) -> Tuple[bool, int, float]:
+        """
+        Consume a request from the bucket.
+        :return: tuple of (allowed, remaining requests, seconds until reset)
+        """
+        now = time.monotonic()
+        with self._lock:
+            reset_at, used = self._buckets.get(bucket, (now + self.window, 0))
+            if now >= reset_at:
+                reset_at, used = now + self.window, 0
+            if used >= self.limit:
+                return False, 0, reset_at - now
+            used += 1
+            self._buckets[bucket] = (reset_at, used)
+            return True, self.limit - used, reset_at - now
+
+
+class FakeDiscordHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately : avoid delayed ACK stalls on keep-alive connections.
+    disable_nagle_algorithm = True
+    server: "FakeDiscordServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Keep load test output clean.
+        pass
+
+    def send_json(self, status: int, body: Dict[str, Any], headers: Dict[str, str]) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        match = ROUTE_PATTERN.match(self.path.split("?")[0])
+        if match is None:
+            self.send_json(404, {"message": "404: Not Found", "code": 0}, {})
+            return
+
+        bucket = match.group(1).rsplit("/", 1)[0] if match.group(3) else match.group(1)
+        allowed, remaining, reset_after = self.server.rate_limiter.hit(bucket)
+        headers = {
+            "X-RateLimit-Limit": str(self.server.rate_limiter.limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": "{:.3f}".format(time.time() + reset_after),
+            "X-RateLimit-Reset-After": "{:.3f}".format(reset_after),
+            "X-RateLimit-Bucket": bucket
+        }
+        if not allowed:
+            self.server.count("rate_limited")
+            self.send_json(429, {
+                "message": "You are being rate limited.",
+                "retry_after": round(reset_after, 3),
+                "global": False
+            }, headers)
+            return
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            self.send_json(400, {"message": "400: Bad Request", "code": 50109}, headers)
+            return
+        error = validate_payload(payload)
+        if error is not None:
+            self.server.count("invalid")
+            self.send_json(400, {"message": "Invalid Form Body", "code": 50035, "errors": error}, headers)
+            return
+
+        self.server.count("accepted")
+        self.send_json(200, {
+            "id": str(self.server.next_id()),
+            "channel_id": match.group(2) or "0",
+            "embeds": payload.get("embeds", [])
+        }, headers)
+
+
+class FakeDiscordServer(ThreadingHTTPServer):
+    """
+    Local stand-in of discord`s message & webhook endpoints.
+    """
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int] = ("127.0.0.1", 0), rate_limit: int = 50, window: float = 1.0) -> None:
+        super().__init__(address, FakeDiscordHandler)
+        self.rate_limiter = RateLimiter(rate_limit, window)
+        self.counters: Dict[str, int] = {}
+        self._id = 0
+        self._lock = threading.Lock()
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + 1
+
+    def next_id(self) -> int:
+        with self._lock:
+            self._id += 1
+            return self._id
+
+    def start(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, name="FakeDiscordServer", daemon=True)
+        thread.start()
+        return thread
+
+
+def make_embed(index: int, fields: int) -> Embed:
+    return Embed(
+        title="Load test #{}".format(index),
+        description="Embed built by load test harness. " * 8,
+        author=AuthorObject(name="load-test", icon_url="https://cdn.discordapp.com/embed/avatars/0.png"),
+        footer=FooterObject(text="footer #{}".format(index)),
+        fields=[Field(name="Field {}".format(i), value="Value {} of embed {}".format(i, index), inline=True)
+                for i in range(fields)]
+    )
+
+
+class Sender(object):
+    """
+    Sends message payloads over a keep-alive connection, retrying rate limited requests.
+    """
+
+    def __init__(self, host: str, port: int, path: str) -> None:
+        self.connection = http.client.HTTPConnection(host, port)
+        self.path = path
+        self.retries = 0
+
+    def send(self, payload: Dict[str, Any]) -> int:
+        body = json.dumps(payload).encode()
+        while True:
+            self.connection.request("POST", self.path, body=body, headers={"Content-Type": "application/json"})
+            response = self.connection.getresponse()
+            data = response.read()
+            if response.status != 429:
+                return response.status
+            self.retries += 1
+            time.sleep(json.loads(data).get("retry_after", 1.0))
+
+
+def run_workload(
+        workload: str,
+        count: int,
+        concurrency: int,
+        fields: int,
+        server: Optional[FakeDiscordServer] = None,
+        path: str = "/api/v10/channels/1/messages"
+) -> Dict[str, Any]:
+    """
+    Run workload and measure latency of each embed.
+    :param workload: "build", "serialize" or "send".
+    :return: report dictionary.
+    """
+    local = threading.local()
+
+    def sender() -> Sender:
+        if not hasattr(local, "sender"):
+            host, port = server.server_address[:2]
+            local.sender = Sender(host, port, path)
+        return local.sender
+
+    def task(index: int) -> Tuple[float, bool]:
+        started = time.perf_counter()
+        embed = make_embed(index, fields)
+        ok = True
+        if workload in ("serialize", "send"):
+            payload = {"embeds": [embed.to_dict()]}
+            if workload == "send":
+                ok = sender().send(payload) == 200
+            else:
+                json.dumps(payload)
+        return time.perf_counter() - started, ok
+
+    if workload not in WORKLOADS:
+        raise ValueError("Unknown workload : {}".format(workload))
+    if workload == "send" and server is None:
+        raise ValueError("Workload 'send' requires a server.")
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        results = list(executor.map(task, range(count)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for latency, _ in results)
+    return {
+        "workload": workload,
+        "count": count,
+        "errors": sum(1 for _, ok in results if not ok),
+        "elapsed": elapsed,
+        "embeds_per_sec": count / elapsed if elapsed else float("inf"),
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000
+    }
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """
+    Nearest-rank percentile of sorted values.
+    :param values: values sorted in ascending order.
+    :param percent: percentile to get, from 0 to 100.
+    :return: smallest value which is greater than or equal to `percent`% of values.
+    """
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, math.ceil(percent / 100 * len(values)) - 1))
+    return values[index]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test of discord_embeds against a local fake discord API.")
+    parser.add_argument("--workload", choices=WORKLOADS, default="send")
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--fields", type=int, default=10)
+    parser.add_argument("--rate-limit", type=int, default=1000, help="requests per window of each bucket.")
+    parser.add_argument("--window", type=float, default=1.0, help="rate limit window in seconds.")
+    parser.add_argument("--webhook", action="store_true", help="send to webhook endpoint instead of channel.")
+    args = parser.parse_args()
+
+    server = None
+    if args.workload == "send":
+        server = FakeDiscordServer(rate_limit=args.rate_limit, window=args.window)
+        server.start()
+    path = "/api/v10/webhooks/1/token" if args.webhook else "/api/v10/channels/1/messages"
+    try:
+        report = run_workload(args.workload, args.count, args.concurrency, args.fields, server, path)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    print("workload      : {}".format(report["workload"]))
+    print("embeds        : {} ({} errors)".format(report["count"], report["errors"]))
+    print("elapsed       : {:.3f} s".format(report["elapsed"]))
+    print("throughput    : {:.1f} embeds/sec".format(report["embeds_per_sec"]))
+    print("latency p50   : {:.3f} ms".format(report["p50_ms"]))
+    print("latency p99   : {:.3f} ms".format(report["p99_ms"]))
+    if server is not None:
+        print("server        : {}".format(server.counters))
+
+
+if __name__ == "__main__":
+    main()
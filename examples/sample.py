@@ -13,7 +13,7 @@ async def on_message(msg):
             color=Colour.orange(),
             embed_type=EmbedType.RICH,
             timestamp=msg.created_at,
-            author=AuthorObject(name=client.user.display_name, url=client.user.avatar_url),
-            footer=FooterObject(text="You can create embeds using objects!", icon_url=msg.author.avatar_url)
+            author=AuthorObject.fromUser(client.user),
+            footer=FooterObject(text="You can create embeds using objects!", icon_url=str(msg.author.avatar_url))
         )
 
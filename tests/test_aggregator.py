@@ -0,0 +1,36 @@
+import gc
+import weakref
+
+import pytest
+
+pytest.importorskip("discord")
+
+from discord_embeds import ErrorAggregator
+
+
+class Marker(object):
+    pass
+
+
+def raise_error(marker):
+    raise ValueError("error")
+
+
+def test_record_does_not_keep_exception():
+    aggregator = ErrorAggregator()
+    marker = Marker()
+    reference = weakref.ref(marker)
+    records = []
+    for _ in range(2):
+        try:
+            raise_error(marker)
+        except ValueError as e:
+            records.append(aggregator.record(e))
+    del marker
+    gc.collect()
+
+    assert reference() is None
+    assert records[0] is records[1]
+    assert records[0].count == 2
+    assert records[0].exception_type == "ValueError"
+    assert "ValueError" in aggregator.embed(records[0]).description
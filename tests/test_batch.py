@@ -0,0 +1,31 @@
+import pytest
+
+pytest.importorskip("discord")
+
+from discord_embeds import FIELD_NAME_LIMIT, build_fields, check_column
+
+
+def test_check_column():
+    assert list(check_column(["a", "b" * FIELD_NAME_LIMIT], FIELD_NAME_LIMIT)) == [False, False]
+    assert list(check_column(["a", "b" * (FIELD_NAME_LIMIT + 1)], FIELD_NAME_LIMIT)) == [False, True]
+    assert list(check_column(["a", None, 1], FIELD_NAME_LIMIT)) == [False, True, True]
+    assert list(check_column([], FIELD_NAME_LIMIT)) == []
+
+
+def test_build_fields_skips_invalid_rows():
+    fields, mask = build_fields(["a", "b", None], ["1", "x" * 2000, "3"], [True, False, False])
+    assert list(mask) == [False, True, True]
+    assert [(field.name, field.value, field.inline) for field in fields] == [("a", "1", True)]
+
+
+def test_numpy_columns():
+    np = pytest.importorskip("numpy")
+    names = np.array(["a", "b" * (FIELD_NAME_LIMIT + 1), "c"])
+    values = np.array(["1", "2", "3"])
+    assert check_column(names, FIELD_NAME_LIMIT).tolist() == [False, True, False]
+    assert check_column(np.array(["a", None], dtype=object), FIELD_NAME_LIMIT).tolist() == [False, True]
+
+    fields, mask = build_fields(names, values, np.array([True, False, False]))
+    assert mask.tolist() == [False, True, False]
+    assert [(field.name, field.value, field.inline) for field in fields] == [("a", "1", True), ("c", "3", False)]
+    assert all(type(field.name) is str and type(field.inline) is bool for field in fields)
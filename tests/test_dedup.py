@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("discord")
+
+from discord_embeds import DedupStore, Embed, Field, content_hash
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr("discord_embeds.dedup.time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def test_identical_embeds_are_suppressed():
+    store = DedupStore(ttl=60)
+    assert store.should_send(1, Embed(title="title"))
+    assert not store.should_send(1, Embed(title="title"))
+    assert store.should_send(2, Embed(title="title"))
+    assert store.should_send(1, Embed(title="other"))
+
+
+def test_discard_allows_retry():
+    store = DedupStore(ttl=60)
+    embed = Embed(title="title")
+    assert store.should_send(1, embed)
+    assert store.discard(1, embed)
+    assert not store.discard(1, embed)
+    assert store.should_send(1, embed)
+
+
+def test_ttl_expiry(clock):
+    store = DedupStore(ttl=10)
+    assert store.should_send(1, Embed(title="title"))
+    clock.now += 9.9
+    assert not store.should_send(1, Embed(title="title"))
+    clock.now += 0.1
+    assert store.should_send(1, Embed(title="title"))
+    # Expiry is counted from the last send, not from suppressed attempts.
+    clock.now += 5
+    assert not store.should_send(1, Embed(title="title"))
+
+
+def test_expired_entries_are_purged(clock):
+    store = DedupStore(ttl=10)
+    for channel_id in range(3):
+        store.should_send(channel_id, Embed(title="title"))
+    clock.now += 10
+    store.should_send(3, Embed(title="title"))
+    assert len(store) == 1
+
+
+def test_ignore_timestamp():
+    now = datetime(2021, 1, 1)
+    first = Embed(title="title", timestamp=now)
+    second = Embed(title="title", timestamp=now + timedelta(seconds=1))
+    assert content_hash(first) == content_hash(second)
+    assert content_hash(first, ignore_timestamp=False) != content_hash(second, ignore_timestamp=False)
+
+    store = DedupStore(ttl=60, ignore_timestamp=False)
+    assert store.should_send(1, first)
+    assert store.should_send(1, second)
+    assert not store.should_send(1, second)
+
+
+def test_sort_fields():
+    first = Embed(title="title", fields=[Field("a", "1"), Field("b", "2")])
+    second = Embed(title="title", fields=[Field("b", "2"), Field("a", "1")])
+    assert content_hash(first) != content_hash(second)
+    assert content_hash(first, sort_fields=True) == content_hash(second, sort_fields=True)
+    assert content_hash(first.to_dict(), sort_fields=True) == content_hash(first, sort_fields=True)
+
+    store = DedupStore(ttl=60, sort_fields=True)
+    assert store.should_send(1, first)
+    assert not store.should_send(1, second)
+
+
+def test_maxsize_evicts_oldest():
+    store = DedupStore(ttl=60, maxsize=2)
+    for title in ("first", "second", "third"):
+        assert store.should_send(1, Embed(title=title))
+    assert len(store) == 2
+    assert not store.should_send(1, Embed(title="third"))
+    assert not store.should_send(1, Embed(title="second"))
+    assert store.should_send(1, Embed(title="first"))
+    assert len(store) == 2
+
+
+def test_hit_and_miss_counters():
+    store = DedupStore(ttl=60)
+    embed = Embed(title="title")
+    store.should_send(1, embed)
+    store.should_send(1, embed)
+    store.should_send(1, embed)
+    store.should_send(2, embed)
+    assert (store.hits, store.misses) == (2, 2)
+    assert repr(store) == "DedupStore(ttl=60,size=2,hits=2,misses=2)"
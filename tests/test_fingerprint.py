@@ -0,0 +1,51 @@
+import traceback
+
+import pytest
+
+pytest.importorskip("discord")
+
+from discord_embeds.fingerprint import (
+    TRUNCATION_MARKER, fingerprint_exception, format_traceback, truncate_traceback
+)
+
+
+def recurse(depth, message="error"):
+    if depth == 0:
+        raise ValueError(message)
+    recurse(depth - 1, message)
+
+
+def catch(depth, message="error"):
+    try:
+        recurse(depth, message)
+    except ValueError as e:
+        return e
+
+
+def test_short_traceback_is_not_truncated():
+    e = catch(1)
+    text = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+    assert format_traceback(e, 10000) == text
+
+
+def test_truncation_keeps_header_and_newest_frames():
+    e = catch(50)
+    assert len(format_traceback(e, 10000)) > 300
+    text = format_traceback(e, 300)
+    assert len(text) <= 300
+    assert text.startswith("Traceback (most recent call last):\n" + TRUNCATION_MARKER)
+    assert text.endswith("ValueError: error\n")
+
+
+def test_long_message_keeps_its_end():
+    message = "x" * 2000 + "end"
+    chunks = ["Traceback (most recent call last):\n", "  frame\n", "ValueError: {}\n".format(message)]
+    # The exception message alone is longer than the budget left after the header, but fits the limit.
+    assert truncate_traceback(chunks, 2030) == chunks[-1]
+
+    assert truncate_traceback(chunks, 10) == chunks[-1][-10:]
+
+
+def test_fingerprint_ignores_message():
+    assert fingerprint_exception(catch(3, "a")) == fingerprint_exception(catch(3, "b"))
+    assert fingerprint_exception(catch(3)) != fingerprint_exception(catch(4))
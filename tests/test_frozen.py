@@ -0,0 +1,87 @@
+import pickle
+
+import pytest
+
+pytest.importorskip("discord")
+
+from discord import Colour
+
+from discord_embeds import Embed, Field, FooterObject, FrozenEmbed, UnexpectedKwargsError, validation_mode
+
+
+def make_frozen():
+    return FrozenEmbed.from_embed(Embed(
+        title="title",
+        description="description",
+        footer=FooterObject(text="footer"),
+        fields=[Field("name", "value")]
+    ))
+
+
+def test_evolve_shares_untouched_parts():
+    frozen = make_frozen()
+    evolved = frozen.evolve(title="other")
+    assert evolved.title == "other"
+    assert frozen.title == "title"
+    assert evolved.footer is frozen.footer
+    assert evolved.fields is frozen.fields
+
+
+def test_immutable_and_hashable():
+    frozen = make_frozen()
+    with pytest.raises(AttributeError):
+        frozen.title = "other"
+    assert frozen == make_frozen()
+    assert hash(frozen) == hash(make_frozen())
+    assert frozen != frozen.evolve(description="other")
+
+
+def test_evolve_rejects_unknown_properties():
+    with pytest.raises(UnexpectedKwargsError):
+        make_frozen().evolve(unknown=1)
+
+
+def test_round_trip():
+    frozen = make_frozen()
+    assert frozen.thaw().to_dict() == frozen.to_dict()
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+
+
+def test_unset_optional_attributes_are_none():
+    frozen = make_frozen()
+    assert frozen.footer.text == "footer"
+    assert frozen.footer.icon_url is None
+    assert "icon_url" not in frozen.footer
+    with pytest.raises(AttributeError):
+        frozen.footer.unknown
+    assert pickle.loads(pickle.dumps(frozen)).footer.icon_url is None
+
+
+def test_properties_are_processed_like_embed():
+    frozen = FrozenEmbed(color="red", timestamp="yesterday", url="attachment://image.png")
+    assert frozen.color == Colour.red().value
+    assert frozen.timestamp is None
+    assert frozen.url is None
+    assert FrozenEmbed(color=None).to_dict().get("color") is None
+    with pytest.raises(KeyError):
+        FrozenEmbed(type="unknown")
+    with pytest.raises(ValueError):
+        FrozenEmbed(fields=[Field(str(index), "value") for index in range(26)])
+
+
+def test_lenient_properties():
+    with validation_mode() as policy:
+        frozen = FrozenEmbed(type="unknown", fields=[Field(str(index), "value") for index in range(26)])
+    assert frozen.type == "rich"
+    assert len(frozen.fields) == 25
+    assert policy.warning_count == 2
+    assert frozen.evolve(fields=frozen.fields[:3]).fields == frozen.fields[:3]
+
+
+def test_missing_color_survives_round_trip():
+    assert Embed.from_dict({"title": "title"}).color is None
+    assert Embed.from_dict({"title": "title", "color": 0xFF0000}).color == Colour(0xFF0000)
+    frozen = FrozenEmbed.from_embed(Embed(title="title", color=None))
+    assert frozen.color is None
+    assert frozen.thaw().color is None
+    assert "color" not in frozen.thaw().to_dict()
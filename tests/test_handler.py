@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import threading
+
+import pytest
+
+pytest.importorskip("discord")
+
+from discord_embeds import EmbedLogHandler
+
+
+def make_logger(handler):
+    logger = logging.getLogger("tests.handler.{}".format(id(handler)))
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    return logger
+
+
+def test_records_are_batched_by_level():
+    sent = []
+    handler = EmbedLogHandler(sent.append, flush_interval=60)
+    logger = make_logger(handler)
+    for index in range(5):
+        logger.info("info %d", index)
+    logger.warning("warning")
+    logger.error("error")
+    handler.close()
+
+    embeds = [embed for batch in sent for embed in batch]
+    assert len(embeds) == 3
+    assert embeds[0].description == "\n".join("info {}".format(index) for index in range(5))
+    assert embeds[1].description == "warning"
+    assert embeds[2].description == "error"
+
+
+def test_description_limit_is_respected():
+    sent = []
+    handler = EmbedLogHandler(sent.append, flush_interval=60, max_records=1000)
+    logger = make_logger(handler)
+    for index in range(300):
+        logger.info("line %04d %s", index, "x" * 40)
+    handler.close()
+
+    embeds = [embed for batch in sent for embed in batch]
+    assert all(len(embed.description) <= 2048 for embed in embeds)
+    assert sum(embed.description.count("\n") + 1 for embed in embeds) == 300
+
+
+def test_full_embeds_are_packed_into_messages():
+    sent = []
+    handler = EmbedLogHandler(sent.append, flush_interval=60, max_records=1)
+    logger = make_logger(handler)
+    for index in range(25):
+        logger.info("info %d", index)
+    handler.close()
+
+    assert [len(batch) for batch in sent] == [10, 10, 5]
+    assert [embed.description for batch in sent for embed in batch] == ["info {}".format(i) for i in range(25)]
+
+
+def test_record_is_formatted_when_emitted():
+    sent = []
+    handler = EmbedLogHandler(sent.append, flush_interval=60)
+    logger = make_logger(handler)
+    values = ["before"]
+    logger.info("value %s", values)
+    values[0] = "after"
+    handler.close()
+
+    assert sent[0][0].description == "value ['before']"
+
+
+def test_timed_out_send_is_failed(monkeypatch):
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    errors = []
+    sent = []
+
+    async def send(embeds):
+        if not sent:
+            sent.append(None)
+            await asyncio.sleep(60)
+        sent.append(embeds)
+
+    handler = EmbedLogHandler(send, loop=loop, flush_interval=60, send_timeout=0.1)
+    monkeypatch.setattr(handler, "handleError", errors.append)
+    logger = make_logger(handler)
+    logger.info("first")
+    handler.flush()
+    logger.info("second")
+    handler.close()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+
+    assert len(errors) == 1
+    assert [embed.description for embed in sent[1]] == ["second"]
+
+
+def recurse(depth):
+    if depth == 0:
+        raise RuntimeError("the exception message")
+    recurse(depth - 1)
+
+
+def test_long_traceback_keeps_exception_message():
+    sent = []
+    handler = EmbedLogHandler(sent.append, flush_interval=60)
+    logger = make_logger(handler)
+    try:
+        recurse(80)
+    except RuntimeError:
+        logger.exception("failed")
+    handler.close()
+
+    description = sent[0][0].description
+    assert len(description) <= 2048
+    assert description.startswith("failed\n")
+    assert description.rstrip().endswith("RuntimeError: the exception message")
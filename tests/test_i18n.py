@@ -0,0 +1,81 @@
+import pytest
+
+pytest.importorskip("discord")
+
+from discord_embeds import Embed, Field, LocalizedEmbed, MessageCatalog
+
+
+def make_catalog():
+    return MessageCatalog({
+        "en-US": {"title": "Hello", "field": "Field", "value": "Value"},
+        "ko": {"title": "안녕하세요", "field": "필드"},
+        "ko-KR": {"title": "안녕하세요!"}
+    })
+
+
+def make_embed(catalog):
+    return LocalizedEmbed(Embed(
+        title="$title",
+        description="$$price",
+        fields=[Field("$field", "$value"), Field("static", "text")]
+    ), catalog)
+
+
+def test_locale_fallback_chain():
+    catalog = make_catalog()
+    assert catalog.resolve_locale("ko-KR") == "ko-KR"
+    assert catalog.resolve_locale("ko-KP") == "ko"
+    assert catalog.resolve_locale("ja-JP") == "en-US"
+    assert catalog.get("ko-KR", "title") == "안녕하세요!"
+    assert catalog.get("ko-KR", "field") == "필드"
+    assert catalog.get("ko-KR", "value") == "Value"
+    with pytest.raises(KeyError):
+        catalog.get("ko-KR", "unknown")
+
+    payload = make_embed(catalog).render("ko-KR")
+    assert payload["title"] == "안녕하세요!"
+    assert payload["fields"][0] == {"name": "필드", "value": "Value", "inline": False}
+    assert payload["fields"][1] == {"name": "static", "value": "text", "inline": False}
+    assert make_embed(catalog).render("ja-JP")["title"] == "Hello"
+
+
+def test_escaped_dollar_is_literal():
+    assert make_embed(make_catalog()).render("en-US")["description"] == "$price"
+
+
+def test_limit_is_checked():
+    catalog = make_catalog()
+    catalog.update("en-GB", {"title": "x" * 300})
+    embed = make_embed(catalog)
+    with pytest.raises(ValueError):
+        embed.render("en-GB")
+
+
+def test_render_is_cached_per_locale():
+    embed = make_embed(make_catalog())
+    first = embed.render("ko-KR")
+    assert embed.render("ko-KR") is first
+    assert embed.render("ko-KP") is embed.render("ko")
+    assert embed.render("ko") is not first
+    assert len(embed.cache) == 2
+
+
+def test_update_invalidates_cache():
+    catalog = make_catalog()
+    embed = make_embed(catalog)
+    first = embed.render("ko")
+    version = catalog.version
+    catalog.update("ko", {"title": "새 제목"})
+    assert catalog.version == version + 1
+    rendered = embed.render("ko")
+    assert rendered is not first
+    assert rendered["title"] == "새 제목"
+    assert first["title"] == "안녕하세요"
+    assert embed.render_embed("ko").title == "새 제목"
+
+
+def test_template_of_locale():
+    catalog = MessageCatalog({"en-US": {"title": "Hello {name}"}})
+    embed = LocalizedEmbed(Embed(title="$title"), catalog)
+    assert embed.template("en-US") is embed.template("en-US")
+    assert embed.template("en-US").render(name="world")["title"] == "Hello world"
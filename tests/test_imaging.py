@@ -0,0 +1,120 @@
+import os
+import struct
+
+import pytest
+
+pytest.importorskip("discord")
+
+from discord_embeds import ImageObject, sniff_image_size
+
+
+def png(width, height):
+    ihdr = struct.pack(">II", width, height) + b"\x08\x06\x00\x00\x00"
+    return (b"\x89PNG\r\n\x1a\n" + struct.pack(">I", len(ihdr)) + b"IHDR" + ihdr + b"\x00" * 4
+            + b"\x00\x00\x00\x00IEND\xaeB`\x82")
+
+
+def gif(width, height):
+    return b"GIF89a" + struct.pack("<HH", width, height) + b"\x00\x00\x00" + b";"
+
+
+def jpeg_segment(marker, payload):
+    return b"\xff" + bytes([marker]) + struct.pack(">H", len(payload) + 2) + payload
+
+
+def jpeg(width, height, sof):
+    return (
+        b"\xff\xd8"
+        + jpeg_segment(0xE0, b"JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00")
+        + jpeg_segment(0xDB, b"\x00" + b"\x01" * 64)
+        # DHT shares the SOFn marker range, and must be skipped.
+        + jpeg_segment(0xC4, b"\x00" + b"\x00" * 16)
+        # Fill byte before the marker.
+        + b"\xff"
+        + jpeg_segment(sof, b"\x08" + struct.pack(">HH", height, width) + b"\x03" + b"\x01\x22\x00" * 3)
+        + b"\xff\xd9"
+    )
+
+
+def webp(chunk, payload):
+    body = b"WEBP" + chunk + struct.pack("<I", len(payload)) + payload
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+def webp_vp8(width, height):
+    # Frame tag, start code, then 14-bit width & height with 2-bit scale.
+    return webp(b"VP8 ", b"\x10\x02\x00" + b"\x9d\x01\x2a"
+                + struct.pack("<HH", width | 0x4000, height | 0x8000) + b"\x00" * 4)
+
+
+def webp_vp8l(width, height):
+    bits = (width - 1) | ((height - 1) << 14) | (1 << 28)
+    return webp(b"VP8L", b"\x2f" + struct.pack("<I", bits) + b"\x00" * 3)
+
+
+def webp_vp8x(width, height):
+    return webp(b"VP8X", b"\x10\x00\x00\x00" + (width - 1).to_bytes(3, "little") + (height - 1).to_bytes(3, "little"))
+
+
+FIXTURES = {
+    "image.png": (png(640, 480), (640, 480)),
+    "image.gif": (gif(320, 200), (320, 200)),
+    "baseline.jpg": (jpeg(800, 600, 0xC0), (800, 600)),
+    "progressive.jpg": (jpeg(1024, 768, 0xC2), (1024, 768)),
+    "lossy.webp": (webp_vp8(400, 300), (400, 300)),
+    "lossless.webp": (webp_vp8l(123, 456), (123, 456)),
+    "extended.webp": (webp_vp8x(1000, 2000), (1000, 2000)),
+}
+
+
+def write(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+@pytest.mark.parametrize("name", sorted(FIXTURES))
+def test_sniff_image_size(tmp_path, name):
+    data, size = FIXTURES[name]
+    assert sniff_image_size(write(tmp_path, name, data)) == size
+
+
+@pytest.mark.parametrize("data", [
+    png(640, 480)[:20],
+    gif(320, 200)[:8],
+    jpeg(800, 600, 0xC0)[:-20],
+    webp_vp8x(1000, 2000)[:26],
+    b"not an image",
+    b""
+])
+def test_truncated_or_unknown_header(tmp_path, data):
+    assert sniff_image_size(write(tmp_path, "broken", data)) is None
+
+
+def test_cache_is_invalidated_when_file_changes(tmp_path):
+    path = write(tmp_path, "image.png", png(640, 480))
+    assert sniff_image_size(path) == (640, 480)
+    stat = os.stat(path)
+
+    # Same path, mtime and size : cached result is used without reading the file.
+    with open(path, "r+b") as file:
+        file.write(png(1, 1))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert sniff_image_size(path) == (640, 480)
+
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    assert sniff_image_size(path) == (1, 1)
+
+    with open(path, "wb") as file:
+        file.write(gif(2, 3))
+    assert sniff_image_size(path) == (2, 3)
+
+
+def test_image_object_from_file(tmp_path):
+    path = write(tmp_path, "image.png", png(640, 480))
+    image = ImageObject.fromFile(path)
+    assert image.toDict() == {"url": "attachment://image.png", "width": 640, "height": 480}
+    assert ImageObject.fromFile(path, filename="other.png").url == "attachment://other.png"
+
+    unknown = ImageObject.fromFile(write(tmp_path, "unknown.bin", b"unknown"))
+    assert unknown.toDict() == {"url": "attachment://unknown.bin"}
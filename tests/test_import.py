@@ -0,0 +1,37 @@
+import warnings
+
+import pytest
+
+pytest.importorskip("discord")
+
+
+def test_import():
+    import discord_embeds
+    assert discord_embeds.Embed is not None
+    assert discord_embeds.EmbedType.RICH.value == "rich"
+
+
+def test_deprecated_objects_warn():
+    from discord_embeds import EmptyObject, Fields, Field
+    with pytest.warns(DeprecationWarning):
+        EmptyObject("title")
+    with pytest.warns(DeprecationWarning):
+        Fields([Field("name", "value")])
+
+
+def test_embed_round_trip():
+    from discord_embeds import Embed, Field, FooterObject, AuthorObject, ImageObject
+    embed = Embed(
+        title="title",
+        description="description",
+        url="https://example.com",
+        author=AuthorObject(name="author", url="https://example.com", icon_url="https://example.com/icon.png",
+                            proxy_icon_url="https://example.com/proxy.png"),
+        footer=FooterObject(text="footer"),
+        image=ImageObject("https://example.com/image.png"),
+        fields=[Field("name", "value", inline=True)]
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        data = embed.to_dict()
+    assert Embed.from_dict(data).to_dict() == data
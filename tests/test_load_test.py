@@ -0,0 +1,26 @@
+import pytest
+
+pytest.importorskip("discord")
+
+from examples.load_test import WORKLOADS, percentile, run_workload
+
+
+@pytest.mark.parametrize("values, percent, expected", [
+    (list(range(100)), 99, 98),
+    (list(range(100)), 50, 49),
+    (list(range(100)), 100, 99),
+    ([1, 2], 50, 1),
+    ([1, 2], 99, 2),
+    ([5], 0, 5),
+    ([], 50, 0.0)
+])
+def test_percentile_is_nearest_rank(values, percent, expected):
+    assert percentile(values, percent) == expected
+
+
+@pytest.mark.parametrize("workload", [workload for workload in WORKLOADS if workload != "send"])
+def test_local_workloads(workload):
+    report = run_workload(workload, count=20, concurrency=2, fields=3)
+    assert report["workload"] == workload
+    assert report["count"] == 20
+    assert report["errors"] == 0
@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("discord")
+
+from discord_embeds import AuthorObject
+
+
+class Member(object):
+    def __init__(self, guild_id, nick, avatar="hash"):
+        self.id = 1
+        self.guild = SimpleNamespace(id=guild_id)
+        self.display_name = nick
+        self.display_avatar = Avatar(avatar)
+
+
+class Avatar(object):
+    def __init__(self, key):
+        self.key = key
+
+    def __str__(self):
+        return "https://cdn.discordapp.com/avatars/1/{}.png".format(self.key)
+
+
+def test_user_objects_are_cached_per_guild():
+    first = AuthorObject.fromUser(Member(1, "first"))
+    second = AuthorObject.fromUser(Member(2, "second"))
+    assert first.name == "first"
+    assert second.name == "second"
+    assert AuthorObject.fromUser(Member(1, "first")) is first
+    assert AuthorObject.fromUser(Member(2, "second")) is second
+
+
+def test_user_object_is_rebuilt_on_change():
+    first = AuthorObject.fromUser(Member(3, "name"))
+    changed = AuthorObject.fromUser(Member(3, "name", avatar="other"))
+    assert changed is not first
+    assert changed.icon_url.endswith("other.png")
@@ -0,0 +1,100 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("discord")
+
+from discord_embeds import Embed, Field, Offloader, configure_offloading, get_policy, validation_mode
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1, thread_name_prefix="offload")
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def current_thread_name():
+    return threading.current_thread().name
+
+
+def build_embed(title, fields):
+    # Module level, so that process executors can pickle it.
+    return Embed(title=title, fields=[Field("name {}".format(i), "value {}".format(i)) for i in range(fields)])
+
+
+@pytest.fixture
+def executor():
+    with CountingExecutor() as executor:
+        yield executor
+
+
+@pytest.fixture
+def offloading(executor):
+    yield configure_offloading(executor, threshold=100)
+    configure_offloading()
+
+
+def test_small_work_runs_inline(executor):
+    offloader = Offloader(executor, threshold=100)
+    assert asyncio.run(offloader.run(current_thread_name, size=99)) == threading.current_thread().name
+    assert executor.submitted == 0
+
+
+@pytest.mark.parametrize("size", [100, 101, None])
+def test_large_work_is_offloaded(executor, size):
+    offloader = Offloader(executor, threshold=100)
+    assert asyncio.run(offloader.run(current_thread_name, size=size)).startswith("offload")
+    assert executor.submitted == 1
+
+
+def test_validation_mode_is_kept_in_thread_executor(executor):
+    offloader = Offloader(executor, threshold=0)
+
+    async def main():
+        with validation_mode() as policy:
+            assert await offloader.run(get_policy, size=1) is policy
+            embed = await offloader.run(lambda: Embed(title="x" * 300), size=1)
+        return policy, embed
+
+    policy, embed = asyncio.run(main())
+    assert len(embed.title) == 256
+    assert policy.warning_count == 1
+    assert executor.submitted == 2
+    # Policy of the caller does not leak into the executor afterwards.
+    assert asyncio.run(offloader.run(get_policy, size=1)) is not policy
+
+
+def test_process_executor():
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        offloader = Offloader(executor, threshold=0)
+        embed = asyncio.run(offloader.run(build_embed, "title", 3, size=1))
+    assert embed.to_dict() == build_embed("title", 3).to_dict()
+
+
+def test_embed_methods_use_configured_offloader(offloading, executor):
+    small = build_embed("small", 0)
+    large = build_embed("large", 10)
+    assert small.estimate_size() < offloading.threshold <= large.estimate_size()
+
+    async def main():
+        assert (await small.to_dict_async()) == small.to_dict()
+        assert (await small.convert()).title == "small"
+        assert executor.submitted == 0
+
+        assert (await large.to_dict_async()) == large.to_dict()
+        assert (await large.convert()).title == "large"
+        assert executor.submitted == 2
+
+        assert (await Embed.build(build_embed, "built", 1, size_hint=99)).title == "built"
+        assert executor.submitted == 2
+        assert (await Embed.build(build_embed, "built", 1, size_hint=100)).title == "built"
+        assert (await Embed.build(build_embed, "built", 1)).title == "built"
+        assert executor.submitted == 4
+
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+pytest.importorskip("discord")
+
+from discord_embeds import Embed, EmbedPaginator
+
+
+def render(rows, page):
+    return Embed(title="Page {}".format(page), description="\n".join(str(row) for row in rows))
+
+
+def run(coroutine):
+    return asyncio.new_event_loop().run_until_complete(coroutine)
+
+
+def test_sqlite_cursor_is_pulled_inline():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE numbers (value INTEGER)")
+    connection.executemany("INSERT INTO numbers VALUES (?)", [(index,) for index in range(25)])
+
+    async def main():
+        paginator = EmbedPaginator(connection.execute("SELECT value FROM numbers"), render, per_page=10)
+        pages = [await paginator.get_page(page) for page in range(3)]
+        await paginator.close()
+        return paginator, pages
+
+    paginator, pages = run(main())
+    assert paginator.page_count == 3
+    assert pages[2].description == "(20,)\n(21,)\n(22,)\n(23,)\n(24,)"
+
+
+def test_evicted_pages_are_reopened():
+    offsets = []
+
+    def reopen(offset):
+        offsets.append(offset)
+        return iter(range(offset, 100))
+
+    async def main():
+        paginator = EmbedPaginator(range(100), render, per_page=10, cache_size=2, prefetch=False,
+                                   reopen=reopen, threaded=True)
+        for page in range(5):
+            await paginator.get_page(page)
+        embed = await paginator.get_page(0)
+        await paginator.close()
+        return paginator, embed
+
+    paginator, embed = run(main())
+    assert offsets == [0]
+    assert embed.description == "\n".join(str(index) for index in range(10))
+    assert len(paginator._rows) <= 2
+
+
+def test_evicted_pages_without_reopen():
+    async def main():
+        paginator = EmbedPaginator(range(100), render, per_page=10, cache_size=2, prefetch=False)
+        for page in range(5):
+            await paginator.get_page(page)
+        try:
+            await paginator.get_page(0)
+        finally:
+            await paginator.close()
+
+    with pytest.raises(IndexError):
+        run(main())
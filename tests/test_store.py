@@ -0,0 +1,106 @@
+import os
+
+import pytest
+
+pytest.importorskip("discord")
+
+from discord_embeds import Embed, EmbedStore, Field
+
+
+def test_put_get_round_trip(tmp_path):
+    path = str(tmp_path / "embeds.db")
+    embed = Embed(title="title", fields=[Field("name", "value")])
+    with EmbedStore(path) as store:
+        store.put(1, embed)
+        assert store.get(1).to_dict() == embed.to_dict()
+        assert store.get(2) is None
+
+    with EmbedStore(path) as store:
+        assert store.get_payload(1) == embed.to_dict()
+
+
+def test_replace_delete_and_compact(tmp_path):
+    path = str(tmp_path / "embeds.db")
+    with EmbedStore(path) as store:
+        for message_id in range(10):
+            store.put(message_id, Embed(title="old {}".format(message_id)))
+        store.put(3, Embed(title="new"))
+        assert store.delete(4)
+        assert not store.delete(4)
+        assert store.garbage_ratio > 0
+
+        size = os.path.getsize(path)
+        store.compact()
+        assert os.path.getsize(path) < size
+        assert store.garbage_ratio == 0
+        assert len(store) == 9
+        assert store.get(3).title == "new"
+        assert 4 not in store
+
+    with EmbedStore(path) as store:
+        assert len(store) == 9
+        assert store.get(9).title == "old 9"
+
+
+def test_incomplete_last_record_is_truncated(tmp_path):
+    path = str(tmp_path / "embeds.db")
+    with EmbedStore(path) as store:
+        store.put(1, Embed(title="title"))
+    with open(path, "ab") as file:
+        file.write(b"\x02\x00\x00")
+    with EmbedStore(path) as store:
+        assert store.get(1).title == "title"
+        store.put(2, Embed(title="after"))
+    with EmbedStore(path) as store:
+        assert store.get(2).title == "after"
+
+
+def test_torn_last_payload_is_truncated(tmp_path):
+    path = str(tmp_path / "embeds.db")
+    with EmbedStore(path) as store:
+        store.put(1, Embed(title="first"))
+        store.put(2, Embed(title="second"))
+    size = os.path.getsize(path)
+    with open(path, "r+b") as file:
+        # Crash left the last payload zero-filled.
+        file.seek(size - 5)
+        file.write(b"\x00" * 5)
+    with EmbedStore(path) as store:
+        assert store.get(1).title == "first"
+        assert 2 not in store
+    assert os.path.getsize(path) < size
+
+
+def test_corrupted_record_in_the_middle_raises(tmp_path):
+    path = str(tmp_path / "embeds.db")
+    with EmbedStore(path) as store:
+        store.put(1, Embed(title="first"))
+        store.put(2, Embed(title="second"))
+    size = os.path.getsize(path)
+    with open(path, "r+b") as file:
+        # Corrupt the payload length of the first record.
+        file.seek(8 + 8)
+        file.write(b"\xff\xff")
+    with pytest.raises(ValueError):
+        EmbedStore(path)
+    assert os.path.getsize(path) == size
+
+
+def test_corrupted_payload_raises_when_read(tmp_path):
+    path = str(tmp_path / "embeds.db")
+    with EmbedStore(path) as store:
+        store.put(1, Embed(title="first"))
+        store.put(2, Embed(title="second"))
+    with open(path, "r+b") as file:
+        file.seek(8 + 20 + 2)
+        file.write(b"#")
+    with EmbedStore(path) as store:
+        assert store.get(2).title == "second"
+        with pytest.raises(ValueError):
+            store.get(1)
+
+
+def test_missing_color_survives_round_trip(tmp_path):
+    with EmbedStore(str(tmp_path / "embeds.db")) as store:
+        store.put(1, Embed(title="title", color=None))
+        assert store.get(1).color is None
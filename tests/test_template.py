@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip("discord")
+
+from discord_embeds import Embed, EmbedTemplate, Field, FooterObject
+
+
+def make_template():
+    return EmbedTemplate(Embed(
+        title="Hello {name}",
+        description="static",
+        footer=FooterObject(text="footer {name}"),
+        fields=[Field("count", "{count}"), Field("static", "value")]
+    ))
+
+
+def test_render_substitutes_placeholders():
+    payload = make_template().render(name="world", count=3)
+    assert payload["title"] == "Hello world"
+    assert payload["footer"]["text"] == "footer world"
+    assert payload["fields"][0]["value"] == "3"
+    assert payload["fields"][1] == {"name": "static", "value": "value", "inline": False}
+
+
+def test_render_does_not_modify_template():
+    template = make_template()
+    template.render(name="a", count=1)
+    assert template.render(name="b", count=2)["title"] == "Hello b"
+
+
+def test_render_checks_limits():
+    with pytest.raises(ValueError):
+        make_template().render(name="x" * 300, count=1)
+
+
+def test_render_embed_round_trip():
+    embed = make_template().render_embed(name="world", count=3)
+    assert isinstance(embed, Embed)
+    assert embed.title == "Hello world"
+    assert embed.fields[0].value == "3"
+
+
+def test_placeholders():
+    assert make_template().placeholders == ["name", "count"]
+
+
+def test_braces_are_unescaped_in_every_property():
+    template = EmbedTemplate(Embed(title="{{literal}} {name}", description="{{literal}}"))
+    payload = template.render(name="world")
+    assert payload["title"] == "{literal} world"
+    assert payload["description"] == "{literal}"
+
+
+@pytest.mark.parametrize("title", ["json: {}", "first: {0}", "item: {0[key]}"])
+def test_positional_placeholders_are_rejected_when_compiling(title):
+    with pytest.raises(ValueError):
+        EmbedTemplate(Embed(title=title))
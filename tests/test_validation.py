@@ -0,0 +1,78 @@
+import pytest
+
+pytest.importorskip("discord")
+
+from discord import Colour
+
+from discord_embeds import (
+    AuthorObject, Embed, EmbedType, FooterObject, ImageObject, InvalidColorError, VideoObject,
+    validate_url, validation_mode
+)
+
+
+def test_validate_url():
+    assert validate_url("https://example.com")
+    assert validate_url("http://example.com")
+    assert not validate_url("httpgarbage")
+    assert not validate_url("attachment://image.png")
+    assert validate_url("attachment://image.png", allow_attachment=True)
+    assert not validate_url(None, allow_attachment=True)
+
+
+def test_attachment_url_is_allowed_for_images_and_icons_only():
+    url = "attachment://image.png"
+    assert ImageObject(url).url == url
+    assert AuthorObject(name="author", icon_url=url).icon_url == url
+    assert FooterObject(text="footer", icon_url=url).icon_url == url
+    assert Embed(title="title", thumbnail=url).thumbnail.url == url
+
+    assert Embed(title="title", url=url).url is None
+    with pytest.raises(ValueError):
+        AuthorObject(name="author", url=url)
+    with pytest.raises(ValueError):
+        VideoObject(url)
+
+
+def test_lenient_color_and_type():
+    with validation_mode() as policy:
+        assert Embed(color=12345).color == Colour(12345)
+        assert Embed(color=None).to_dict().get("color") is None
+        assert Embed(color="red").color == Colour.red()
+        assert Embed(color="unknown").color == Colour.blurple()
+        assert Embed(color=1.5).color == Colour.blurple()
+        assert Embed(embed_type="rich").type == EmbedType.RICH
+        assert Embed(embed_type="unknown").type == EmbedType.RICH
+    assert policy.warning_count == 3
+
+
+def test_strict_color_and_type():
+    with pytest.raises(ValueError):
+        Embed(color="unknown")
+    with pytest.raises(InvalidColorError):
+        Embed(color=1.5)
+    with pytest.raises(KeyError):
+        Embed(embed_type="unknown")
+
+
+def test_warnings_are_bounded():
+    with validation_mode(max_warnings=5) as policy:
+        for _ in range(20):
+            Embed(title="x" * 300)
+    assert len(policy.warnings) == 5
+    assert policy.warning_count == 20
+
+
+def test_empty_fields_are_dropped():
+    fields = [
+        {"name": "name", "value": "value"},
+        {"name": None, "value": "value"},
+        {"name": "name", "value": ""},
+        {"value": "value"}
+    ]
+    with validation_mode() as policy:
+        embed = Embed.from_dict({"title": "title", "fields": fields})
+    assert [field.toDict() for field in embed.fields] == [{"name": "name", "value": "value", "inline": False}]
+    assert any("must not be empty" in warning for warning in policy.warnings)
+
+    with pytest.raises(ValueError):
+        Embed(fields=[{"name": "name", "value": ""}])